@@ -0,0 +1,287 @@
+"""
+Замеры производительности методов пакета comp_math на задачах возрастающего размера.
+
+Для каждого метода и размера задачи записываются время выполнения (лучшее из нескольких
+запусков), количество вычислений функции, количество итераций и пиковый объем памяти,
+выделенной при выполнении (tracemalloc). Результаты сохраняются в JSON, чтобы их можно
+было сравнить между коммитами.
+
+Запуск из корня репозитория:
+    python benchmarks/run.py                          # все замеры, результат в benchmarks/results/<коммит>.json
+    python benchmarks/run.py --filter quad --quick    # только интегрирование, малые размеры
+    python benchmarks/run.py --compare benchmarks/results/<старый коммит>.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from comp_math import Monitor, interp, linalg, quad, roots  # noqa: E402
+
+BENCHMARKS = []
+
+
+def benchmark(name: str, sizes: list, quick: int = 2) -> Callable:
+    """
+    Регистрирует замер. Декорируемая функция получает размер задачи и возвращает
+    функцию без аргументов, выполняющую замеряемый вызов; подготовка данных в замер не входит.
+    Замеряемая функция может вернуть словарь с количеством итераций ("iterations").
+
+    Параметры:
+        name: Имя замера (группа.метод).
+        sizes: Размеры задачи.
+        quick: Количество первых размеров, используемых в режиме --quick.
+    """
+    def register(setup: Callable) -> Callable:
+        BENCHMARKS.append((name, sizes, quick, setup))
+        return setup
+    return register
+
+
+class CountingFunction:
+    """
+    Обертка функции, подсчитывающая количество ее вызовов и вычисленных значений
+    (при вызове от массива учитывается каждый его элемент).
+    """
+
+    def __init__(self, func: Callable):
+        self.func = func
+        self.calls = 0
+        self.evaluations = 0
+
+    def __call__(self, x, *args):
+        self.calls += 1
+        self.evaluations += np.size(x)
+        return self.func(x, *args)
+
+
+def _cubic(x):
+    return x ** 3 + 0.2 * x ** 2 + 0.5 * x - 1.2
+
+
+def _integrand(x):
+    return np.log10(x ** 2 + 1) / x
+
+
+def _dominant_matrix(n: int) -> tuple[np.ndarray, np.ndarray]:
+    # матрица с диагональным преобладанием: сходятся и прямые, и итерационные методы
+    rng = np.random.default_rng(n)
+    a = rng.uniform(-1, 1, (n, n))
+    a[np.diag_indices(n)] = np.abs(a).sum(axis=1) + 1
+    return a, rng.uniform(-1, 1, n)
+
+
+def _iterations(result) -> dict:
+    return {"iterations": result.iterations}
+
+
+def _monitored(method: Callable) -> dict:
+    # для методов, возвращающих только число, итерации считает монитор
+    monitor = Monitor(keep_history=False)
+    method(monitor)
+    return {"iterations": monitor.iterations}
+
+
+# нелинейные уравнения: размер — количество верных знаков (epsilon = 10^-size)
+for _name, _method in [("bisection_method", lambda f, eps: _monitored(
+                           lambda monitor: roots.bisection_method(f, 0.8, 0.9, eps, monitor=monitor))),
+                       ("newton_method", lambda f, eps: _iterations(roots.newton_method(f, 0.9, eps, mode="dual"))),
+                       ("secant_method", lambda f, eps: _iterations(roots.secant_method(f, 0.8, 0.9, eps))),
+                       ("halley_method", lambda f, eps: _iterations(roots.halley_method(f, 0.9, eps, mode="dual"))),
+                       ("simple_iteration_method", lambda f, eps: _monitored(
+                           lambda monitor: roots.simple_iteration_method(f, 0.8, 0.9, eps, monitor=monitor)))]:
+    @benchmark(f"roots.{_name}", sizes=[3, 6, 9, 12])
+    def _root_case(size, method=_method):
+        return lambda func: method(func, 10.0 ** -size)
+
+for _name, _method in [("batch_bisection", lambda c, a, b: roots.batch_bisection(c, a, b, 1e-10)),
+                       ("batch_newton", lambda c, a, b: roots.batch_newton(c, b, 1e-10)),
+                       ("batch_illinois", lambda c, a, b: roots.batch_illinois(c, a, b, 1e-10))]:
+    @benchmark(f"roots.{_name}", sizes=[1_000, 10_000, 100_000, 1_000_000])
+    def _batch_root_case(size, method=_method):
+        free_terms = np.linspace(-2.0, -0.5, size)
+        coefficients = np.column_stack([np.ones(size), np.full(size, 0.2), np.full(size, 0.5), free_terms])
+        a, b = np.zeros(size), np.full(size, 2.0)
+        return lambda: {"iterations": int(method(coefficients, a, b).iterations.max())}
+
+
+# системы линейных уравнений: размер — порядок матрицы
+@benchmark("linalg.gauss", sizes=[100, 300, 1000, 2000])
+def _gauss_case(size):
+    a, b = _dominant_matrix(size)
+    return lambda: linalg.gauss(a, b, verbose=False)
+
+
+@benchmark("linalg.gauss_mixed", sizes=[100, 300, 1000, 2000])
+def _gauss_mixed_case(size):
+    a, b = _dominant_matrix(size)
+    return lambda: linalg.gauss(a, b, verbose=False, precision="mixed")
+
+
+for _name, _method in [("jacobi", lambda a, b: linalg.jacobi(a, b, 1e-8)),
+                       ("gauss_seidel", lambda a, b: linalg.gauss_seidel(a, b, 1e-8)),
+                       ("conjugate_gradient", lambda a, b: linalg.conjugate_gradient(a.T @ a, b, 1e-8))]:
+    @benchmark(f"linalg.{_name}", sizes=[100, 300, 1000, 2000])
+    def _iterative_case(size, method=_method):
+        a, b = _dominant_matrix(size)
+        return lambda: _iterations(method(a, b))
+
+
+@benchmark("linalg.batch_gauss", sizes=[1_000, 10_000, 100_000, 1_000_000])
+def _batch_gauss_case(size):
+    rng = np.random.default_rng(size)
+    a = rng.standard_normal((size, 3, 3)) + 3 * np.eye(3)
+    b = rng.standard_normal((size, 3))
+    return lambda: linalg.batch_gauss(a, b)
+
+
+# интерполяция: размер — количество узлов, значения вычисляются в 10000 точках
+for _name, _method in [("lagrange_interpolation", interp.lagrange_interpolation),
+                       ("newton_interpolation", interp.newton_interpolation),
+                       ("CubicSpline", lambda x, y, x0: interp.CubicSpline(x, y)(x0))]:
+    @benchmark(f"interp.{_name}", sizes=[10, 30, 100, 300])
+    def _interp_case(size, method=_method):
+        x = np.cos(np.pi * (np.arange(size) + 0.5) / size)[::-1]  # узлы Чебышева по возрастанию
+        y = np.sin(3 * x)
+        x0 = np.linspace(-0.99, 0.99, 10_000)
+        return lambda: method(x, y, x0)
+
+
+# интегрирование: размер — количество интервалов разбиения
+for _name, _method in [("rectangular_rule", quad.rectangular_rule),
+                       ("trapezoidal_rule", quad.trapezoidal_rule),
+                       ("simpson_rule", quad.simpson_rule)]:
+    @benchmark(f"quad.{_name}", sizes=[1_000, 10_000, 100_000, 1_000_000, 10_000_000])
+    def _rule_case(size, method=_method):
+        return lambda func: method(0.8, 1.6, size, func)
+
+
+for _name, _method in [("adaptive_quadrature", lambda f, eps: quad.adaptive_quadrature(0.8, 1.6, eps, f)),
+                       ("romberg", lambda f, eps: quad.romberg(0.8, 1.6, eps, f))]:
+    @benchmark(f"quad.{_name}", sizes=[4, 8, 12])
+    def _adaptive_case(size, method=_method):
+        return lambda func: {"intervals": method(func, 10.0 ** -size).intervals}
+
+
+@benchmark("quad.gauss_legendre", sizes=[5, 20, 100, 1000])
+def _gauss_legendre_case(size):
+    quad.gauss_legendre_nodes(size)  # узлы вычисляются один раз и в замер не входят
+    return lambda func: quad.gauss_legendre(0.8, 1.6, size, func)
+
+
+@benchmark("quad.batch_integrate", sizes=[1_000, 10_000, 100_000, 1_000_000])
+def _batch_integrate_case(size):
+    upper = np.linspace(1.0, 2.0, size)
+    return lambda func: quad.batch_integrate(0.8, upper, func, n=10)
+
+
+@benchmark("quad.stream_integral", sizes=[100_000, 1_000_000, 10_000_000])
+def _stream_integral_case(size):
+    # отсчеты уже вычислены; пиковая память не должна расти с количеством отсчетов
+    samples = _integrand(np.linspace(0.8, 1.6, size + 1))
+    return lambda: quad.stream_integral(samples, 0.8 / size, rule="simpson", chunk_size=65536)
+
+
+# функция, которую передают методу (по сигнатуре замеряемой функции)
+_FUNCTIONS = {"roots": _cubic, "quad": _integrand}
+
+
+def measure(name: str, size, setup: Callable, repeat: int) -> dict:
+    """
+    Выполняет один замер: лучшее время из repeat запусков, пиковую память
+    и счетчики вычислений функции для одного запуска.
+    """
+    run = setup(size)
+    needs_func = run.__code__.co_argcount == 1
+    group = name.split(".")[0]
+
+    def call() -> tuple[dict, CountingFunction | None]:
+        func = CountingFunction(_FUNCTIONS[group]) if needs_func else None
+        info = run(func) if needs_func else run()
+        return (info if isinstance(info, dict) else {}), func
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        info, func = call()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    call()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    record = {"name": name, "size": size, "time": min(times), "peak_memory": peak_memory}
+    if func is not None:
+        record["evaluations"] = func.evaluations
+        record["calls"] = func.calls
+    record.update(info)
+    return record
+
+
+def git_commit() -> str | None:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def compare(results: list[dict], path: str) -> None:
+    """Печатает отношение времени и памяти к результатам из файла path."""
+    with open(path, encoding="utf-8") as file:
+        previous = {(r["name"], r["size"]): r for r in json.load(file)["results"]}
+    print(f"\nСравнение с {path} (отношение новое / старое):")
+    for record in results:
+        old = previous.get((record["name"], record["size"]))
+        if old is not None:
+            print(f"{record['name']:<32} {record['size']:>10}  время x{record['time'] / old['time']:.2f}  "
+                  f"память x{record['peak_memory'] / max(old['peak_memory'], 1):.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="подстрока имени замера")
+    parser.add_argument("--repeat", type=int, default=3, help="количество запусков для замера времени")
+    parser.add_argument("--quick", action="store_true", help="только малые размеры задач")
+    parser.add_argument("--output", help="файл результатов (по умолчанию benchmarks/results/<коммит>.json)")
+    parser.add_argument("--compare", help="файл результатов для сравнения")
+    args = parser.parse_args()
+
+    results = []
+    for name, sizes, quick, setup in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        for size in sizes[:quick] if args.quick else sizes:
+            record = measure(name, size, setup, args.repeat)
+            results.append(record)
+            counters = ", ".join(f"{key} {record[key]}" for key in ("evaluations", "iterations", "intervals")
+                                 if key in record)
+            print(f"{name:<32} {size:>10}  {record['time'] * 1000:10.3f} мс  "
+                  f"{record['peak_memory'] / 2 ** 20:8.2f} МиБ  {counters}")
+
+    commit = git_commit()
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"{commit or 'results'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump({"commit": commit, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                   "python": platform.python_version(), "numpy": np.__version__,
+                   "machine": platform.machine(), "results": results}, file, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены в {output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
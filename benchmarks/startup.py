@@ -0,0 +1,76 @@
+"""
+Проверка времени запуска: сколько стоит импорт пакета comp_math в новом процессе
+и не загружаются ли при этом тяжелые зависимости (scipy, sympy) раньше, чем нужно.
+
+Запуск из корня репозитория:
+    python benchmarks/startup.py [--repeat 10]
+
+Код возврата 1 означает, что бюджет времени превышен или загружена лишняя зависимость.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("scipy", "sympy")
+
+# сценарий: (код, бюджет на импорт сверх пустого интерпретатора в мс, допустимые тяжелые зависимости)
+SCENARIOS = [
+    ("import comp_math", 50, ()),
+    ("from comp_math.roots import bisection_method", 300, ()),
+    ("from comp_math.roots import bisection_method; bisection_method(lambda x: x - 1, 0, 2, 1e-6)", 300, ()),
+    ("from comp_math.quad import simpson_rule", 300, ()),
+    ("from comp_math.interp import NewtonInterpolator", 300, ()),
+    ("from comp_math.linalg import batch_gauss", 300, ()),
+    ("from comp_math.linalg import jacobi", 300, ()),
+    ("import numpy as np; from comp_math.linalg import jacobi; jacobi(np.diag([4.0, 3.0]) + 1, np.ones(2), 1e-8)",
+     300, ()),
+    ("from comp_math.linalg import gauss, gauss_seidel, gmres", 300, ()),
+    ("from comp_math.roots import newton_method; newton_method('x**3 - 1', 2, 1e-8)", 2000, ("sympy",)),
+]
+
+
+def run(code: str) -> tuple[float, list[str]]:
+    """
+    Выполняет код в новом процессе интерпретатора.
+
+    Возвращает:
+        tuple: время выполнения в секундах и список загруженных тяжелых зависимостей.
+    """
+    probe = f"{code}\nimport sys, json\nprint(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", probe], env=env, check=True, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    return elapsed, json.loads(output.stdout.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="количество запусков каждого сценария")
+    args = parser.parse_args()
+
+    # время запуска пустого интерпретатора вычитается из времени сценариев
+    baseline = min(run("pass")[0] for _ in range(args.repeat))
+    failed = False
+    print(f"Пустой интерпретатор: {baseline * 1000:.0f} мс")
+    for code, budget, allowed in SCENARIOS:
+        times, loaded = [], []
+        for _ in range(args.repeat):
+            elapsed, loaded = run(code)
+            times.append(elapsed - baseline)
+        cost = statistics.median(times) * 1000
+        extra = sorted(set(loaded) - set(allowed))
+        ok = cost <= budget and not extra
+        failed |= not ok
+        print(f"[{'OK' if ok else 'FAIL'}] {cost:7.0f} мс (бюджет {budget} мс) {code}"
+              + (f" — загружены: {', '.join(extra)}" if extra else ""))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
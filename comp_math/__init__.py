@@ -0,0 +1,24 @@
+"""
+Общие компоненты лабораторных работ по вычислительной математике.
+
+Подпакеты:
+    roots: Решение нелинейных уравнений (лабораторная работа 1).
+    linalg: Решение систем линейных уравнений (лабораторная работа 2).
+    interp: Интерполяция функций (лабораторная работа 3).
+    quad: Численное интегрирование (лабораторная работа 4).
+    expressions: Компиляция функций, заданных записью выражения.
+    instrumentation: Сбор метрик работы методов (класс Monitor).
+
+Подпакеты и их модули загружаются при первом обращении, поэтому
+scipy и sympy импортируются только тогда, когда они действительно нужны.
+"""
+from comp_math._lazy import lazy_exports
+
+_EXPORTS = {
+    "roots": None, "linalg": None, "interp": None, "quad": None, "expressions": None,
+    "instrumentation": None, "Monitor": "instrumentation",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
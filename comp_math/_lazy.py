@@ -0,0 +1,30 @@
+import importlib
+import sys
+
+
+def lazy_exports(package: str, exports: dict[str, str | None]) -> tuple[callable, callable]:
+    """
+    Строит функции __getattr__ и __dir__ пакета (PEP 562), которые загружают подмодуль
+    только при первом обращении к экспортируемому из него имени. Благодаря этому импорт
+    пакета не тянет за собой scipy и sympy, пока они не понадобятся.
+
+    Параметры:
+        package: Имя пакета (__name__).
+        exports: Соответствие экспортируемых имен и подмодулей пакета; None вместо
+            имени подмодуля означает, что экспортируется сам подмодуль с этим именем.
+
+    Возвращаемое значение:
+        Кортеж функций (__getattr__, __dir__) для пространства имен пакета.
+    """
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(f"{package}.{exports[name] or name}")
+        value = module if exports[name] is None else getattr(module, name)
+        setattr(sys.modules[package], name, value)  # последующие обращения минуют __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
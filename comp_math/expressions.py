@@ -0,0 +1,247 @@
+import io
+import tokenize
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+
+# имена функций и констант, допустимые в записи выражения (кроме переменной)
+_ALLOWED_NAMES = frozenset({
+    "sin", "cos", "tan", "cot", "sec", "csc", "asin", "acos", "atan", "acot",
+    "sinh", "cosh", "tanh", "coth", "asinh", "acosh", "atanh",
+    "exp", "log", "ln", "log10", "log2", "sqrt", "cbrt", "Abs", "abs", "sign", "floor", "ceiling",
+    "pi", "E",
+})
+_ALLOWED_OPERATORS = frozenset({"+", "-", "*", "/", "**", "^", "(", ")", ","})
+_IGNORED_TOKENS = frozenset({tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER})
+
+
+def _check_expression(text: str, variable: str) -> None:
+    """
+    Проверяет запись выражения по белому списку лексем до передачи в sympy
+    (parse_expr выполняет разобранную строку через eval). Допускаются только числа,
+    переменная, имена из _ALLOWED_NAMES и арифметические операции, поэтому обращения
+    к атрибутам, вызовы произвольных функций, строки и служебные имена отвергаются.
+    """
+    if not variable.isidentifier() or variable.startswith("_") or variable in _ALLOWED_NAMES:
+        raise ValueError(f"Недопустимое имя переменной: {variable!r}")
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(text).readline))
+    except (tokenize.TokenError, SyntaxError) as error:
+        raise ValueError(f"Некорректная запись выражения: {text!r}") from error
+    for token in tokens:
+        if token.type in _IGNORED_TOKENS or token.type == tokenize.NUMBER:
+            continue
+        if token.type == tokenize.NAME and (token.string == variable or token.string in _ALLOWED_NAMES):
+            continue
+        if token.type == tokenize.OP and token.string in _ALLOWED_OPERATORS:
+            continue
+        raise ValueError(f"Недопустимый элемент выражения: {token.string!r}")
+
+
+@lru_cache(maxsize=None)
+def _parser_settings() -> tuple[tuple, dict]:
+    """
+    Преобразования разбора и функции, которых нет в пространстве имен sympy по умолчанию.
+    sympy импортируется при первом разборе выражения, а не при загрузке модуля.
+    """
+    import sympy as sp
+    from sympy.parsing.sympy_parser import (convert_xor, implicit_multiplication_application,
+                                            standard_transformations)
+
+    transformations = standard_transformations + (convert_xor, implicit_multiplication_application)
+    local_functions = {
+        "log10": lambda arg: sp.log(arg, 10),
+        "log2": lambda arg: sp.log(arg, 2),
+        "ln": sp.log,
+    }
+    return transformations, local_functions
+
+
+def _vectorized(compiled: callable) -> callable:
+    """
+    Дополняет функцию, полученную lambdify, приведением результата к форме аргумента
+    (для выражений без переменной lambdify возвращает константу).
+    """
+    def wrapper(x):
+        y = compiled(x)
+        return y if np.shape(y) == np.shape(x) else np.full(np.shape(x), y, dtype=float)
+    return wrapper
+
+
+class CompiledExpression:
+    """
+    Выражение от одной переменной, скомпилированное в векторизованную функцию numpy.
+
+    Объект вызывается как обычная функция f(x) (x — число или массив numpy).
+    Производные строятся символьно при первом запросе и кешируются.
+
+    Атрибуты:
+        expr: Символьное выражение sympy.
+        symbol: Переменная выражения.
+    """
+
+    def __init__(self, expr: "sp.Expr", symbol: "sp.Symbol"):
+        import sympy as sp
+
+        self.expr = expr
+        self.symbol = symbol
+        self._compiled = {0: _vectorized(sp.lambdify(symbol, expr, "numpy"))}
+
+    def __call__(self, x):
+        return self._compiled[0](x)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.expr})"
+
+    def derivative(self, order: int = 1) -> callable:
+        """
+        Возвращает скомпилированную производную заданного порядка.
+
+        Параметры:
+            order: Порядок производной.
+
+        Возвращаемое значение:
+            Векторизованная функция f^(order)(x).
+        """
+        if order not in self._compiled:
+            import sympy as sp
+
+            expr = sp.diff(self.expr, self.symbol, order)
+            self._compiled[order] = _vectorized(sp.lambdify(self.symbol, expr, "numpy"))
+        return self._compiled[order]
+
+
+class ExpressionRegistry:
+    """
+    LRU-кеш скомпилированных выражений с ограниченным размером.
+
+    Выражение разбирается sympy один раз; повторные запросы той же строки
+    (с точностью до пробелов) и эквивалентных по записи sympy строк возвращают
+    уже скомпилированный объект. При переполнении вытесняется выражение,
+    которое дольше всех не запрашивалось.
+
+    Атрибуты:
+        maxsize: Максимальное количество хранимых выражений.
+        hits: Количество запросов, обслуженных из кеша.
+        misses: Количество запросов, потребовавших компиляции.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        if maxsize < 1:
+            raise ValueError("Размер кеша должен быть положительным")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._aliases = OrderedDict()  # исходная строка -> нормализованная запись
+        self._compiled = OrderedDict()  # нормализованная запись -> CompiledExpression
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def get(self, text: str, variable: str = "x") -> CompiledExpression:
+        """
+        Возвращает скомпилированное выражение, разбирая строку только при промахе кеша.
+        Перед разбором запись проверяется по белому списку: допускаются числа, переменная,
+        элементарные функции, константы pi и E и арифметические операции.
+
+        Параметры:
+            text: Запись выражения, например "x**3 + 0.2*x**2 + 0.5*x - 1.2".
+            variable: Имя переменной выражения.
+
+        Возвращаемое значение:
+            CompiledExpression для данного выражения.
+        """
+        alias = (variable, "".join(text.split()))
+        key = self._aliases.get(alias)
+        if key is not None and key in self._compiled:
+            self._aliases.move_to_end(alias)
+            self._compiled.move_to_end(key)
+            self.hits += 1
+            return self._compiled[key]
+
+        _check_expression(text, variable)
+        import sympy as sp
+        from sympy.parsing.sympy_parser import parse_expr
+
+        transformations, local_functions = _parser_settings()
+        symbol = sp.Symbol(variable)
+        expr = parse_expr(text, local_dict={variable: symbol, **local_functions},
+                          transformations=transformations)
+        unknown = expr.free_symbols - {symbol}
+        if unknown:
+            raise ValueError(f"Неизвестные переменные в выражении: {', '.join(map(str, unknown))}")
+
+        key = (variable, sp.srepr(expr))
+        self._remember(self._aliases, alias, key)
+        if key in self._compiled:
+            self._compiled.move_to_end(key)
+            self.hits += 1
+        else:
+            self._remember(self._compiled, key, CompiledExpression(expr, symbol))
+            self.misses += 1
+        return self._compiled[key]
+
+    def clear(self) -> None:
+        """Очищает кеш и счетчики."""
+        self._aliases.clear()
+        self._compiled.clear()
+        self.hits = self.misses = 0
+
+    def _remember(self, cache: OrderedDict, key, value) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+
+default_registry = ExpressionRegistry()
+
+
+def compile_expression(text: str, variable: str = "x") -> CompiledExpression:
+    """
+    Компилирует выражение через общий реестр default_registry.
+
+    Параметры:
+        text: Запись выражения.
+        variable: Имя переменной выражения.
+
+    Возвращаемое значение:
+        CompiledExpression для данного выражения.
+    """
+    return default_registry.get(text, variable)
+
+
+def as_function(func: Callable | str) -> callable:
+    """
+    Приводит функцию, заданную строкой или вызываемым объектом, к вызываемому объекту.
+
+    Параметры:
+        func: Функция f(x) или запись выражения.
+
+    Возвращаемое значение:
+        Функция f(x): скомпилированное выражение для строки или сам func.
+    """
+    return compile_expression(func) if isinstance(func, str) else func
+
+
+def tabulate(values: Callable | str | list, x_values: list) -> list | np.ndarray:
+    """
+    Возвращает таблицу значений функции в узлах x_values.
+
+    Параметры:
+        values: Готовый список значений, функция f(x) или запись выражения.
+        x_values: Узлы таблицы.
+
+    Возвращаемое значение:
+        values, если это уже таблица, иначе массив значений функции в узлах.
+    """
+    if isinstance(values, str) or callable(values):
+        return as_function(values)(np.asarray(x_values, dtype=float))
+    return values
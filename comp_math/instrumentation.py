@@ -0,0 +1,127 @@
+import functools
+import inspect
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+
+class Monitor:
+    """
+    Сборщик метрик работы численных методов.
+
+    Монитор передается методу аргументом monitor. Метод сообщает ему о каждой итерации,
+    а вычисления функции и умножения матрицы на вектор подсчитываются обертками,
+    которые метод ставит только при переданном мониторе. Без монитора методы не выполняют
+    никакой дополнительной работы. Метрики накапливаются, если один монитор передается
+    в несколько вызовов.
+
+    Атрибуты:
+        callback: Функция callback(iteration, x, residual), вызываемая после каждой итерации.
+        iterations: Количество итераций.
+        evaluations: Количество вычисленных значений функции (для массива — по числу элементов).
+        matvecs: Количество умножений матрицы на вектор.
+        residuals: История невязок (оценок погрешности) по итерациям.
+        elapsed: Суммарное время работы методов в секундах.
+        calls: Количество вызовов методов.
+    """
+
+    def __init__(self, callback: Callable | None = None, keep_history: bool = True):
+        """
+        Аргументы:
+            callback (callable | None): Функция callback(iteration, x, residual) или None.
+            keep_history (bool): Сохранять ли историю невязок.
+        """
+        self.callback = callback
+        self.keep_history = keep_history
+        self.iterations = 0
+        self.evaluations = 0
+        self.matvecs = 0
+        self.residuals = []
+        self.elapsed = 0.0
+        self.calls = 0
+
+    def function(self, func: Callable) -> Callable:
+        """
+        Возвращает обертку функции, подсчитывающую количество вычисленных значений.
+
+        Аргументы:
+            func (callable): Функция f(x, *args).
+
+        Возвращает:
+            callable: Функция с тем же поведением.
+        """
+        @functools.wraps(func)
+        def counted(x, *args):
+            self.evaluations += np.size(x)
+            return func(x, *args)
+        return counted
+
+    def operator(self, matvec: Callable) -> Callable:
+        """
+        Возвращает обертку умножения матрицы на вектор, подсчитывающую количество умножений.
+
+        Аргументы:
+            matvec (callable): Функция x -> A x.
+
+        Возвращает:
+            callable: Функция с тем же поведением.
+        """
+        def counted(x):
+            self.matvecs += 1
+            return matvec(x)
+        return counted
+
+    def step(self, x, residual: float, iterations: int = 1) -> None:
+        """
+        Регистрирует выполненную итерацию.
+
+        Аргументы:
+            x: Текущее приближение.
+            residual (float): Невязка или оценка погрешности текущего приближения.
+            iterations (int): Количество итераций, выполненных с предыдущего вызова
+                (если метод проверяет невязку не на каждой итерации).
+        """
+        self.iterations += iterations
+        if self.keep_history:
+            self.residuals.append(float(residual))
+        if self.callback is not None:
+            self.callback(self.iterations, x, residual)
+
+    def as_dict(self) -> dict:
+        """
+        Возвращает метрики в виде словаря (например, для передачи в систему мониторинга).
+        """
+        return {
+            "calls": self.calls,
+            "iterations": self.iterations,
+            "evaluations": self.evaluations,
+            "matvecs": self.matvecs,
+            "elapsed": self.elapsed,
+            "residual": self.residuals[-1] if self.residuals else None,
+        }
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Декоратор численного метода с аргументом monitor: измеряет время работы,
+    записывает его в поле elapsed результата (если результат — NamedTuple с таким полем)
+    и добавляет к метрикам монитора. Монитор может быть передан как по имени, так и по позиции.
+    """
+    position = list(inspect.signature(method).parameters).index("monitor")
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        monitor = args[position] if len(args) > position else kwargs.get("monitor")
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if monitor is not None:
+                monitor.elapsed += elapsed
+                monitor.calls += 1
+        if "elapsed" in getattr(result, "_fields", ()):
+            result = result._replace(elapsed=elapsed)
+        return result
+    return wrapper
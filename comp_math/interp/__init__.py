@@ -0,0 +1,17 @@
+"""
+Интерполяция функций: многочлены Лагранжа и Ньютона, кубические сплайны.
+
+Модули загружаются при первом обращении к экспортируемому из них имени.
+"""
+from comp_math._lazy import lazy_exports
+
+_EXPORTS = {
+    "LagrangeInterpolator": "lagrange", "lagrange_interpolation": "lagrange", "lagrange_error": "lagrange",
+    "NewtonInterpolator": "newton", "FiniteDifferenceInterpolator": "newton",
+    "newton_interpolation": "newton",
+    "CubicSpline": "spline",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,201 @@
+from math import factorial
+
+import numpy as np
+
+from comp_math.expressions import CompiledExpression, as_function, tabulate
+
+
+def _derivative(func, order: int) -> callable:
+    """
+    Строит производную заданного порядка для записи выражения, скомпилированного выражения
+    или функции, которую можно вычислить от символа sympy.
+    """
+    if isinstance(func, (str, CompiledExpression)):
+        return as_function(func).derivative(order)
+    import sympy as sp
+
+    x = sp.Symbol("x", real=True)
+    try:
+        expr = sp.sympify(func(x))
+    except (TypeError, AttributeError, ValueError, NotImplementedError) as error:
+        raise ValueError("Для оценки погрешности функцию нужно продифференцировать символьно: задайте ее "
+                         "записью выражения (например, 'exp(x)') или операциями, поддерживаемыми sympy") from error
+    return CompiledExpression(expr, x).derivative(order)
+
+
+class LagrangeInterpolator:
+    """
+    Интерполяционный многочлен Лагранжа в барицентрической форме.
+
+    Барицентрические веса w_i = 1 / prod(x_i - x_j, j != i) вычисляются один раз при
+    построении (O(n^2)), после чего значение многочлена в каждой точке вычисляется за O(n):
+        p(x) = sum(w_i * y_i / (x - x_i)) / sum(w_i / (x - x_i))
+
+    Атрибуты:
+        x_values (numpy.ndarray): x-координаты узлов интерполяции.
+        y_values (numpy.ndarray): y-координаты узлов интерполяции.
+        weights (numpy.ndarray): барицентрические веса узлов.
+    """
+
+    def __init__(self, x_values, y_values):
+        """
+        Аргументы:
+            x_values (list): список x-координат точек данных (попарно различных).
+            y_values (list | callable | str): список y-координат точек данных
+                или функция (запись выражения), значения которой берутся в узлах x_values.
+        """
+        self.x_values = np.array(x_values, dtype=float)
+        self.y_values = np.array(tabulate(y_values, x_values), dtype=float)
+        if len(self.y_values) != len(self.x_values):
+            raise ValueError("Количество x- и y-координат не совпадает")
+        differences = self.x_values[:, None] - self.x_values[None, :]
+        np.fill_diagonal(differences, 1.0)
+        if np.any(differences == 0):
+            raise ValueError("Узлы интерполяции должны быть попарно различны")
+        self.weights = 1 / differences.prod(axis=1)
+        self._derivative_bounds = {}  # оценки производных, зависящие только от таблицы узлов
+
+    def __len__(self) -> int:
+        return len(self.x_values)
+
+    def __call__(self, x, chunk_size: int = 4096):
+        """
+        Вычисляет значения интерполирующего многочлена.
+
+        Аргументы:
+            x (float | numpy.ndarray): точка или массив точек.
+            chunk_size (int): количество точек, обрабатываемых за один шаг (ограничивает память).
+
+        Возвращает:
+            float | numpy.ndarray: значения многочлена той же формы, что и x.
+        """
+        points = np.asarray(x, dtype=float)
+        flat = points.ravel()
+        result = np.empty_like(flat)
+        for start in range(0, flat.size, chunk_size):
+            chunk = flat[start:start + chunk_size]
+            differences = chunk[:, None] - self.x_values[None, :]
+            exact = differences == 0  # точка совпадает с узлом интерполяции
+            differences[exact] = 1.0
+            terms = self.weights / differences
+            values = (terms @ self.y_values) / terms.sum(axis=1)
+            hit_rows, hit_nodes = np.nonzero(exact)
+            values[hit_rows] = self.y_values[hit_nodes]
+            result[start:start + chunk_size] = values
+        result = result.reshape(points.shape)
+        return result if result.ndim else float(result)
+
+    def add_node(self, x: float, y: float) -> None:
+        """
+        Добавляет узел интерполяции, пересчитывая веса за O(n).
+
+        Аргументы:
+            x (float): x-координата нового узла.
+            y (float): y-координата нового узла.
+        """
+        differences = self.x_values - x
+        if np.any(differences == 0):
+            raise ValueError("Узлы интерполяции должны быть попарно различны")
+        self.weights = np.append(self.weights / differences, 1 / np.prod(-differences))
+        self.x_values = np.append(self.x_values, x)
+        self.y_values = np.append(self.y_values, y)
+        self._derivative_bounds.clear()
+
+    def update_values(self, y_values) -> None:
+        """
+        Заменяет y-координаты узлов; веса от них не зависят и не пересчитываются.
+
+        Аргументы:
+            y_values (list | callable | str): новые y-координаты или функция (запись выражения).
+        """
+        y_values = np.array(tabulate(y_values, self.x_values), dtype=float)
+        if y_values.shape != self.x_values.shape:
+            raise ValueError("Количество x- и y-координат не совпадает")
+        self.y_values = y_values
+        self._derivative_bounds.pop(None, None)  # оценка по таблице зависит от y-координат
+
+    def node_polynomial(self, x, chunk_size: int = 4096):
+        """
+        Вычисляет многочлен узлов omega(x) = prod(x - x_i).
+
+        Аргументы:
+            x (float | numpy.ndarray): точка или массив точек.
+            chunk_size (int): количество точек, обрабатываемых за один шаг.
+
+        Возвращает:
+            float | numpy.ndarray: значения omega(x) той же формы, что и x.
+        """
+        points = np.asarray(x, dtype=float)
+        flat = points.ravel()
+        result = np.empty_like(flat)
+        for start in range(0, flat.size, chunk_size):
+            chunk = flat[start:start + chunk_size]
+            result[start:start + chunk_size] = (chunk[:, None] - self.x_values[None, :]).prod(axis=1)
+        result = result.reshape(points.shape)
+        return result if result.ndim else float(result)
+
+    def error_bound(self, x, func=None, samples: int = 1001):
+        """
+        Оценивает погрешность интерполяции в точках x.
+
+        Оценка вычисляется по одной формуле |R(x)| <= M * |omega(x)|, где M = max|f^(n)| / n!.
+        Если порождающая функция func известна, n-я производная строится sympy, а максимум
+        берется по сетке из samples точек на отрезке узлов. Иначе M оценивается по таблице
+        старшей разделенной разностью |f(x_0, ..., x_n-1)| = |sum(w_i * y_i)| (для разности
+        порядка n нужен еще один узел).
+        Оценка M вычисляется один раз для таблицы узлов и затем переиспользуется.
+
+        Аргументы:
+            x (float | numpy.ndarray): точка или массив точек.
+            func (str | callable, опционально): порождающая функция: запись выражения или функция,
+                которую можно вычислить от символа sympy (numpy.exp и т. п. не поддерживаются).
+            samples (int): количество точек сетки для оценки максимума производной.
+
+        Возвращает:
+            float | numpy.ndarray: оценки погрешности той же формы, что и x.
+        """
+        n = len(self)
+        key = None if func is None else (func, samples)
+        if key not in self._derivative_bounds:
+            if func is None:
+                self._derivative_bounds[key] = abs(self.weights @ self.y_values)
+            else:
+                derivative = _derivative(func, n)
+                grid = np.linspace(self.x_values.min(), self.x_values.max(), samples)
+                self._derivative_bounds[key] = np.abs(derivative(grid)).max() / factorial(n)
+        return self._derivative_bounds[key] * np.abs(self.node_polynomial(x))
+
+
+def lagrange_interpolation(x_values, y_values, x):
+    """
+    Расчитывает значение в точке x для интерполирующего многочлена
+    для данной последовательности точек, используя метод Лагранжа.
+    Для многократных вычислений по одной таблице следует использовать LagrangeInterpolator.
+
+    Аргументы:
+        x_values (list): список x-координат точек данных.
+        y_values (list | callable | str): список y-координат точек данных
+            или функция (запись выражения), значения которой берутся в узлах x_values.
+        x (float | numpy.ndarray): точка (или массив точек), в которой вычисляется полином.
+
+    Возвращает:
+        float | numpy.ndarray: значение интерполирующего полинома в точке x.
+    """
+    return LagrangeInterpolator(x_values, y_values)(x)
+
+
+def lagrange_error(x_values, y_values, x):
+    """
+    Вычислить погрешность в интерполяции Лагранжа.
+    Для многократных вычислений по одной таблице следует использовать LagrangeInterpolator.error_bound.
+
+    Аргументы:
+        x_values (list): список x-координат точек данных.
+        y_values (list | callable | str): список y-координат точек данных
+            или функция (запись выражения), значения которой берутся в узлах x_values.
+        x (float | numpy.ndarray): точка (или массив точек), в которой вычисляется ошибка.
+
+    Возвращает:
+        float | numpy.ndarray: оценка погрешности интерполяции Лагранжа в точке x.
+    """
+    return LagrangeInterpolator(x_values, y_values).error_bound(x)
@@ -0,0 +1,193 @@
+import numpy as np
+
+from comp_math.expressions import tabulate
+
+
+class NewtonInterpolator:
+    """
+    Интерполяционный многочлен Ньютона с разделенными разностями:
+        P(x) = c_0 + c_1 (x - x_0) + ... + c_n-1 (x - x_0) ... (x - x_n-2),
+    где c_k = f[x_0, ..., x_k].
+
+    Коэффициенты вычисляются один раз на месте в одном векторе (O(n) памяти),
+    значения вычисляются по схеме Горнера сразу для массива точек. Для добавления
+    узла хранится последняя диагональ таблицы разделенных разностей
+    f[x_n-1], f[x_n-2, x_n-1], ..., f[x_0, ..., x_n-1], поэтому новый коэффициент
+    вычисляется за O(n).
+
+    Атрибуты:
+        x_values (numpy.ndarray): узлы интерполяции.
+        coefficients (numpy.ndarray): разделенные разности f[x_0, ..., x_k].
+    """
+
+    def __init__(self, x_values, y_values):
+        """
+        Параметры:
+        x_values (list): Список точек интерполяции (попарно различных).
+        y_values (list | callable | str): Список значений функции в точках интерполяции
+            или сама функция (запись выражения).
+        """
+        self.x_values = np.array(x_values, dtype=float)
+        table = np.array(tabulate(y_values, x_values), dtype=float)
+        n = len(self.x_values)
+        if len(table) != n:
+            raise ValueError("Количество точек и значений функции не совпадает")
+
+        self.coefficients = table.copy()
+        self._diagonal = np.empty(n)
+        if n:
+            self._diagonal[0] = table[-1]
+        # заполнение таблицы разделенных разностей по столбцам на месте
+        for i in range(1, n):
+            denominators = self.x_values[i:] - self.x_values[:n - i]
+            if np.any(denominators == 0):
+                raise ValueError("Точки интерполяции должны быть попарно различны")
+            table[:n - i] = (table[1:n - i + 1] - table[:n - i]) / denominators
+            self.coefficients[i] = table[0]
+            self._diagonal[i] = table[n - i - 1]
+
+    def __len__(self) -> int:
+        return len(self.x_values)
+
+    def __call__(self, x):
+        """
+        Вычисляет значения интерполирующего многочлена по схеме Горнера.
+
+        Параметры:
+        x (float | numpy.ndarray): Точка или массив точек.
+
+        Возвращает:
+        float | numpy.ndarray: Значения многочлена той же формы, что и x.
+        """
+        points = np.asarray(x, dtype=float)
+        result = np.full(points.shape, self.coefficients[-1])
+        for c, xi in zip(self.coefficients[-2::-1], self.x_values[-2::-1]):
+            result *= points - xi
+            result += c
+        return result if result.ndim else float(result)
+
+    def add_node(self, x: float, y: float) -> None:
+        """
+        Добавляет узел интерполяции, вычисляя новый коэффициент за O(n).
+
+        Параметры:
+        x (float): Новая точка интерполяции.
+        y (float): Значение функции в ней.
+        """
+        n = len(self.x_values)
+        denominators = x - self.x_values[::-1]  # x - x_n-1, x - x_n-2, ..., x - x_0
+        if np.any(denominators == 0):
+            raise ValueError("Точки интерполяции должны быть попарно различны")
+        diagonal = np.empty(n + 1)
+        diagonal[0] = y
+        for k in range(1, n + 1):
+            diagonal[k] = (diagonal[k - 1] - self._diagonal[k - 1]) / denominators[k - 1]
+        self._diagonal = diagonal
+        self.x_values = np.append(self.x_values, x)
+        self.coefficients = np.append(self.coefficients, diagonal[n])
+
+
+class FiniteDifferenceInterpolator:
+    """
+    Интерполяция по таблице с постоянным шагом h первой и второй формулами Ньютона
+    на окне из window ближайших узлов.
+
+    Таблица конечных разностей Δ^j y_i (j < window) вычисляется один раз. Окно
+    находится арифметикой индексов за O(1): t = (x - x_0) / h. В левой половине окна
+    используется первая формула (интерполирование вперед от начала окна s):
+        P = y_s + q Δy_s + q (q - 1) / 2! Δ^2 y_s + ...,   q = t - s,
+    в правой половине и при экстраполяции за конец таблицы — вторая формула
+    (интерполирование назад от конца окна e):
+        P = y_e + q ∇y_e + q (q + 1) / 2! ∇^2 y_e + ...,   q = t - e,   ∇^j y_e = Δ^j y_e-j.
+
+    Атрибуты:
+        x0 (float): первый узел таблицы.
+        h (float): шаг таблицы.
+        window (int): количество узлов, по которым строится многочлен.
+        differences (list): массивы конечных разностей Δ^j y для j = 0, ..., window - 1.
+    """
+
+    def __init__(self, x_values, y_values, window: int = 6):
+        """
+        Параметры:
+        x_values (list): Равноотстоящие точки интерполяции в порядке возрастания.
+        y_values (list | callable | str): Значения функции в точках интерполяции
+            или сама функция (запись выражения).
+        window (int): Количество ближайших узлов, используемых для вычисления значения.
+        """
+        x_values = np.asarray(x_values, dtype=float)
+        y_values = np.array(tabulate(y_values, x_values), dtype=float)
+        if len(x_values) < 2 or len(y_values) != len(x_values):
+            raise ValueError("Нужно не менее двух точек и столько же значений функции")
+        self.x0 = x_values[0]
+        self.h = (x_values[-1] - x_values[0]) / (len(x_values) - 1)
+        if self.h <= 0 or not np.allclose(np.diff(x_values), self.h, rtol=1e-6, atol=0):
+            raise ValueError("Точки интерполяции должны быть равноотстоящими и возрастающими")
+        if window < 1:
+            raise ValueError("Размер окна должен быть положительным")
+        self.window = min(window, len(x_values))
+
+        self.differences = [y_values]
+        for _ in range(1, self.window):
+            self.differences.append(np.diff(self.differences[-1]))
+
+    def __len__(self) -> int:
+        return len(self.differences[0])
+
+    def __call__(self, x):
+        """
+        Вычисляет значения интерполирующего многочлена на окне ближайших узлов.
+
+        Параметры:
+        x (float | numpy.ndarray): Точка или массив точек.
+
+        Возвращает:
+        float | numpy.ndarray: Значения той же формы, что и x.
+        """
+        points = np.asarray(x, dtype=float)
+        t = ((points - self.x0) / self.h).ravel()
+        k = self.window
+        # начало окна из k ближайших узлов, прижатого к границам таблицы
+        start = np.clip(np.rint(t - (k - 1) / 2), 0, len(self) - k).astype(int)
+        end = start + k - 1
+        forward = t - start <= (k - 1) / 2
+
+        result = np.zeros_like(t)
+        # первая формула Ньютона
+        q = t[forward] - start[forward]
+        values = np.zeros_like(q)
+        coefficient = np.ones_like(q)
+        for j in range(k):
+            values += coefficient * self.differences[j][start[forward]]
+            coefficient *= (q - j) / (j + 1)
+        result[forward] = values
+        # вторая формула Ньютона
+        backward = ~forward
+        q = t[backward] - end[backward]
+        values = np.zeros_like(q)
+        coefficient = np.ones_like(q)
+        for j in range(k):
+            values += coefficient * self.differences[j][end[backward] - j]
+            coefficient *= (q + j) / (j + 1)
+        result[backward] = values
+
+        result = result.reshape(points.shape)
+        return result if result.ndim else float(result)
+
+
+def newton_interpolation(x, y, x0):
+    """
+    Вычисляет значение интерполированной функции в точке x0 с использованием интерполяционной формулы Ньютона.
+    Для многократных вычислений по одной таблице следует использовать NewtonInterpolator.
+
+    Параметры:
+    x (list): Список точек интерполяции.
+    y (list | callable | str): Список значений функции в точках интерполяции
+        или сама функция (запись выражения).
+    x0 (float | numpy.ndarray): Точка (или массив точек), в которой требуется вычислить
+        значение интерполированной функции.
+
+    Возвращает:
+    y0 (float | numpy.ndarray): Значение интерполированной функции в точке x0.
+    """
+    return NewtonInterpolator(x, y)(x0)
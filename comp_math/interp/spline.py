@@ -0,0 +1,131 @@
+import os
+
+import numpy as np
+
+from comp_math.expressions import tabulate
+
+
+class CubicSpline:
+    """
+    Интерполяционный кубический сплайн.
+
+    Вторые производные M_i в узлах находятся из ленточной системы за O(n):
+        h_i-1 M_i-1 + 2 (h_i-1 + h_i) M_i + h_i M_i+1 = 6 (d_i - d_i-1),   d_i = (y_i+1 - y_i) / h_i,
+    дополненной граничными условиями. На отрезке [x_i, x_i+1] сплайн хранится
+    коэффициентами многочлена от t = x - x_i:
+        S(x) = a_i + b_i t + c_i t^2 + e_i t^3.
+    Отрезок для точки ищется двоичным поиском (numpy.searchsorted) сразу для массива точек.
+
+    Атрибуты:
+        knots (numpy.ndarray): узлы сплайна (по возрастанию).
+        coefficients (numpy.ndarray): коэффициенты a, b, c, e формы (n - 1, 4).
+    """
+
+    def __init__(self, x_values, y_values, bc: str = "natural", derivatives: tuple[float, float] = (0.0, 0.0)):
+        """
+        Аргументы:
+            x_values (list): возрастающие узлы интерполяции.
+            y_values (list | callable | str): значения функции в узлах или сама функция (запись выражения).
+            bc (str): граничные условия: "natural" (S'' = 0 на концах), "clamped" (заданы S' на концах)
+                или "not-a-knot" (непрерывность S''' во втором и предпоследнем узлах).
+            derivatives (tuple): значения S'(x_0) и S'(x_n-1) для bc="clamped".
+        """
+        x = np.asarray(x_values, dtype=float)
+        y = np.asarray(tabulate(y_values, x_values), dtype=float)
+        n = len(x)
+        if len(y) != n or n < 2:
+            raise ValueError("Нужно не менее двух узлов и столько же значений функции")
+        h = np.diff(x)
+        if np.any(h <= 0):
+            raise ValueError("Узлы сплайна должны строго возрастать")
+        if bc == "not-a-knot" and n < 4:
+            raise ValueError("Условие not-a-knot требует не менее четырех узлов")
+        d = np.diff(y) / h
+
+        # ленточная матрица в формате solve_banded с двумя диагоналями сверху и снизу:
+        # band[2 + i - j, j] = A[i, j]
+        band = np.zeros((5, n))
+        rhs = np.zeros(n)
+        band[2, 1:-1] = 2 * (h[:-1] + h[1:])
+        band[1, 2:] = h[1:]
+        band[3, :-2] = h[:-1]
+        rhs[1:-1] = 6 * (d[1:] - d[:-1])
+
+        if bc == "natural":
+            band[2, 0] = band[2, -1] = 1.0
+        elif bc == "clamped":
+            band[2, 0], band[1, 1] = 2 * h[0], h[0]
+            rhs[0] = 6 * (d[0] - derivatives[0])
+            band[3, -2], band[2, -1] = h[-1], 2 * h[-1]
+            rhs[-1] = 6 * (derivatives[1] - d[-1])
+        elif bc == "not-a-knot":
+            band[2, 0], band[1, 1], band[0, 2] = h[1], -(h[0] + h[1]), h[0]
+            band[4, -3], band[3, -2], band[2, -1] = h[-1], -(h[-2] + h[-1]), h[-2]
+        else:
+            raise ValueError(f"Неизвестные граничные условия: {bc}")
+
+        from scipy.linalg import solve_banded  # scipy загружается при построении первого сплайна
+
+        m = solve_banded((2, 2), band, rhs)
+        self.knots = x
+        self.coefficients = np.column_stack([
+            y[:-1],
+            d - h * (2 * m[:-1] + m[1:]) / 6,
+            m[:-1] / 2,
+            (m[1:] - m[:-1]) / (6 * h),
+        ])
+
+    def __len__(self) -> int:
+        return len(self.knots)
+
+    def __call__(self, x, chunk_size: int = 1 << 20):
+        """
+        Вычисляет значения сплайна (за пределами узлов — продолжение крайних многочленов).
+
+        Аргументы:
+            x (float | numpy.ndarray): точка или массив точек.
+            chunk_size (int): количество точек, обрабатываемых за один шаг.
+
+        Возвращает:
+            float | numpy.ndarray: значения сплайна той же формы, что и x.
+        """
+        points = np.asarray(x, dtype=float)
+        flat = points.ravel()
+        result = np.empty_like(flat)
+        for start in range(0, flat.size, chunk_size):
+            chunk = flat[start:start + chunk_size]
+            index = np.clip(np.searchsorted(self.knots, chunk, side="right") - 1, 0, len(self.knots) - 2)
+            t = chunk - self.knots[index]
+            a, b, c, e = np.asarray(self.coefficients[index]).T
+            result[start:start + chunk_size] = a + t * (b + t * (c + t * e))
+        result = result.reshape(points.shape)
+        return result if result.ndim else float(result)
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет узлы и коэффициенты в каталог path (файлы knots.npy и coefficients.npy).
+
+        Аргументы:
+            path (str): каталог для сохранения.
+        """
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "knots.npy"), self.knots)
+        np.save(os.path.join(path, "coefficients.npy"), self.coefficients)
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: str | None = "r") -> "CubicSpline":
+        """
+        Загружает сплайн, сохраненный методом save. По умолчанию файлы отображаются в память
+        (numpy.memmap), и с диска читаются только страницы, нужные для запрошенных точек.
+
+        Аргументы:
+            path (str): каталог с сохраненным сплайном.
+            mmap_mode (str | None): режим отображения файлов в память; None — загрузить в память целиком.
+
+        Возвращает:
+            CubicSpline: загруженный сплайн.
+        """
+        spline = cls.__new__(cls)
+        spline.knots = np.load(os.path.join(path, "knots.npy"), mmap_mode=mmap_mode)
+        spline.coefficients = np.load(os.path.join(path, "coefficients.npy"), mmap_mode=mmap_mode)
+        return spline
@@ -0,0 +1,19 @@
+"""
+Решение систем линейных уравнений: прямые, итерационные и пакетные методы.
+
+Модули загружаются при первом обращении к экспортируемому из них имени.
+"""
+from comp_math._lazy import lazy_exports
+
+_EXPORTS = {
+    "lu_factor": "lu", "lu_solve": "lu", "iterative_refinement": "lu", "gauss": "lu",
+    "IterationResult": "simple_iteration", "split_diagonal": "simple_iteration", "jacobi": "simple_iteration",
+    "estimate_omega": "seidel", "multicolor_ordering": "seidel", "gauss_seidel": "seidel",
+    "as_operator": "krylov", "jacobi_preconditioner": "krylov", "ssor_preconditioner": "krylov",
+    "ilu_preconditioner": "krylov", "conjugate_gradient": "krylov", "gmres": "krylov", "bicgstab": "krylov",
+    "BatchSolution": "batch", "batch_gauss": "batch",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
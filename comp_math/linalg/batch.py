@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+
+class BatchSolution(NamedTuple):
+    """
+    Результат пакетного решения систем линейных уравнений.
+
+    Поля:
+        x (numpy.ndarray): Решения формы (batch, n); для вырожденных систем — nan.
+        singular (numpy.ndarray): Булев массив признаков вырожденности каждой системы.
+    """
+    x: np.ndarray
+    singular: np.ndarray
+
+
+def _solve_chunk(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Решает пакет систем методом Гаусса с выбором главного элемента,
+    выполняя каждый шаг исключения сразу для всех систем пакета.
+    Массивы a и b изменяются на месте.
+    """
+    batch, n, _ = a.shape
+    rows = np.arange(batch)
+    # порог вырожденности относительно масштаба каждой матрицы
+    tolerance = n * np.finfo(float).eps * np.abs(a).max(axis=(1, 2))
+    singular = np.zeros(batch, dtype=bool)
+
+    for i in range(n):
+        # нахождение индекса строки с максимальным абсолютным значением в каждой системе
+        max_row_index = np.abs(a[:, i:, i]).argmax(axis=1) + i
+
+        # перестановка строк
+        swap = max_row_index != i
+        if swap.any():
+            r, p = rows[swap], max_row_index[swap]
+            a[r, i], a[r, p] = a[r, p], a[r, i].copy()
+            b[r, i], b[r, p] = b[r, p], b[r, i].copy()
+
+        pivot = a[:, i, i]
+        bad = np.abs(pivot) <= tolerance
+        singular |= bad
+        pivot = np.where(bad, 1.0, pivot)
+
+        # зануление i-тых элементов строк всех систем
+        factors = a[:, i + 1:, i] / pivot[:, None]
+        a[:, i + 1:, i:] -= factors[:, :, None] * a[:, None, i, i:]
+        b[:, i + 1:] -= factors * b[:, None, i]
+
+    diagonal = np.where(singular[:, None], 1.0, np.diagonal(a, axis1=1, axis2=2))
+    x = np.zeros_like(b)
+    for i in range(n - 1, -1, -1):
+        x[:, i] = (b[:, i] - np.einsum("bj,bj->b", a[:, i, i + 1:], x[:, i + 1:])) / diagonal[:, i]
+    x[singular] = np.nan
+    return x, singular
+
+
+def batch_gauss(a: np.ndarray, b: np.ndarray, chunk_size: int = 65536,
+                processes: int | None = 1) -> BatchSolution:
+    """
+    Рассчитывает решения множества независимых систем линейных уравнений методом Гаусса.
+
+    Исключение выполняется векторно по всему пакету. Пакет обрабатывается частями
+    по chunk_size систем, поэтому дополнительная память не зависит от размера пакета;
+    части могут распределяться по процессам.
+
+    Параметры:
+        a (numpy.ndarray): Матрицы коэффициентов формы (batch, n, n).
+        b (numpy.ndarray): Векторы правых частей формы (batch, n).
+        chunk_size (int): Количество систем в одной части.
+        processes (int | None): Количество процессов. 1 — без пула процессов,
+            None — по числу ядер процессора.
+
+    Возвращает:
+        BatchSolution: решения и признаки вырожденности систем.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if a.ndim != 3 or a.shape[1] != a.shape[2] or b.shape != a.shape[:2]:
+        raise ValueError("Ожидаются массивы формы (batch, n, n) и (batch, n)")
+
+    batch = len(a)
+    x = np.empty_like(b)
+    singular = np.empty(batch, dtype=bool)
+    bounds = [(start, min(start + chunk_size, batch)) for start in range(0, batch, chunk_size)]
+
+    if processes == 1 or len(bounds) <= 1:
+        for start, stop in bounds:
+            x[start:stop], singular[start:stop] = _solve_chunk(a[start:stop].copy(), b[start:stop].copy())
+    else:
+        with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+            chunks = executor.map(_solve_chunk, (a[start:stop] for start, stop in bounds),
+                                  (b[start:stop] for start, stop in bounds))
+            for (start, stop), (x_chunk, singular_chunk) in zip(bounds, chunks):
+                x[start:stop], singular[start:stop] = x_chunk, singular_chunk
+    return BatchSolution(x, singular)
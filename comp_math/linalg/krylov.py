@@ -0,0 +1,299 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from comp_math.instrumentation import Monitor, instrumented
+from comp_math.linalg.seidel import sweep_solver
+from comp_math.linalg.simple_iteration import IterationResult, split_diagonal
+
+if TYPE_CHECKING:
+    import scipy.sparse as sps
+    from scipy.sparse.linalg import LinearOperator
+
+
+def as_operator(a, n: int) -> "LinearOperator":
+    """
+    Приводит матрицу, разреженную матрицу, LinearOperator или функцию v -> A v к LinearOperator.
+
+    Параметры:
+        a: Матрица коэффициентов или линейный оператор (в том числе без явной матрицы).
+        n (int): Размерность системы.
+
+    Возвращает:
+        scipy.sparse.linalg.LinearOperator: Оператор умножения на матрицу.
+    """
+    from scipy.sparse.linalg import LinearOperator, aslinearoperator
+
+    if callable(a) and not isinstance(a, LinearOperator):
+        return LinearOperator((n, n), matvec=a, dtype=float)
+    return aslinearoperator(a)
+
+
+def _split_matrix(a) -> "tuple[np.ndarray, np.ndarray | sps.csr_matrix]":
+    from scipy.sparse.linalg import LinearOperator
+
+    if not hasattr(a, "diagonal") or isinstance(a, LinearOperator):
+        raise ValueError("Для построения предобуславливателя нужна явная матрица коэффициентов")
+    return split_diagonal(a)
+
+
+def jacobi_preconditioner(a) -> callable:
+    """
+    Строит предобуславливатель Якоби M = D.
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов.
+
+    Возвращает:
+        callable: Функция r -> M^-1 r.
+    """
+    d, _ = _split_matrix(a)
+    inv_d = 1 / d
+    return lambda r: inv_d * r
+
+
+def ssor_preconditioner(a, omega: float = 1.0) -> callable:
+    """
+    Строит предобуславливатель SSOR, соответствующий симметричному проходу метода Гаусса-Зейделя:
+       M = ω / (2 - ω) * (D / ω + L) (D / ω)^-1 (D / ω + U)
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов.
+        omega (float): Параметр релаксации из (0, 2).
+
+    Возвращает:
+        callable: Функция r -> M^-1 r.
+    """
+    if not 0 < omega < 2:
+        raise ValueError("Параметр релаксации должен лежать в интервале (0, 2)")
+    d, _ = _split_matrix(a)
+    # прямой и обратный проходы метода релаксации (см. seidel.gauss_seidel)
+    forward, backward = sweep_solver(a, d, omega), sweep_solver(a, d, omega, lower=False)
+    scale = (2 - omega) / omega
+    return lambda r: scale * backward(d / omega * forward(r))
+
+
+def ilu_preconditioner(a, drop_tol: float = 1e-4, fill_factor: float = 20) -> callable:
+    """
+    Строит предобуславливатель на основе неполного LU-разложения (scipy.sparse.linalg.spilu).
+    Предобуславливатель несимметричен, поэтому предназначен для GMRES и BiCGSTAB.
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов.
+        drop_tol (float): Порог отбрасывания малых элементов.
+        fill_factor (float): Допустимое увеличение числа ненулевых элементов.
+
+    Возвращает:
+        callable: Функция r -> M^-1 r.
+    """
+    import scipy.sparse as sps
+    from scipy.sparse.linalg import spilu
+
+    factors = spilu(sps.csc_matrix(a, dtype=float), drop_tol=drop_tol, fill_factor=fill_factor)
+    return factors.solve
+
+
+_PRECONDITIONERS = {
+    "jacobi": jacobi_preconditioner,
+    "ssor": ssor_preconditioner,
+    "ilu": ilu_preconditioner,
+}
+
+
+def _setup(a, b, x0, preconditioner, monitor):
+    b = np.asarray(b, dtype=float)
+    n = len(b)
+    if isinstance(preconditioner, str):
+        if preconditioner not in _PRECONDITIONERS:
+            raise ValueError(f"Неизвестный предобуславливатель: {preconditioner}")
+        preconditioner = _PRECONDITIONERS[preconditioner](a)
+    elif preconditioner is None:
+        preconditioner = lambda r: r
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    op = as_operator(a, n)
+    if monitor is not None:
+        op = as_operator(monitor.operator(op.matvec), n)
+    return op, b, x, preconditioner, np.linalg.norm(b) or 1.0
+
+
+@instrumented
+def conjugate_gradient(a, b, epsilon=0.001, max_iterations=1000, x0: np.ndarray = None,
+                       preconditioner: str | Callable = None, monitor: Monitor | None = None) -> IterationResult:
+    """
+    Рассчитывает решение системы с симметричной положительно определенной матрицей
+    методом сопряженных градиентов (с предобуславливанием).
+
+    Параметры:
+        a: Матрица коэффициентов (numpy, scipy.sparse), LinearOperator или функция v -> A v.
+        b (numpy.ndarray): Вектор правых частей системы линейных уравнений.
+        epsilon (float, опционально): Точность сходимости по относительной невязке. По умолчанию 0.001.
+        max_iterations (int, опционально): Максимальное количество итераций. По умолчанию 1000.
+        x0 (numpy.ndarray, опционально): Начальное приближение. По умолчанию нулевой вектор.
+        preconditioner (str | callable, опционально): "jacobi", "ssor", "ilu" или функция r -> M^-1 r.
+        monitor (Monitor, опционально): Монитор для сбора метрик (итерации, умножения матрицы
+            на вектор, невязки, время). По умолчанию None.
+
+    Возвращает:
+        IterationResult: решение, количество итераций, история невязок и признак сходимости.
+    """
+    op, b, x, precondition, b_norm = _setup(a, b, x0, preconditioner, monitor)
+    r = b - op.matvec(x)
+    residuals = [np.linalg.norm(r) / b_norm]
+    if residuals[-1] < epsilon:
+        return IterationResult(x, 0, residuals, True)
+
+    z = precondition(r)
+    p = z.copy()
+    rz = r @ z
+    for iteration in range(1, max_iterations + 1):
+        ap = op.matvec(p)
+        alpha = rz / (p @ ap)
+        x += alpha * p
+        r -= alpha * ap
+        residuals.append(np.linalg.norm(r) / b_norm)
+        if monitor is not None:
+            monitor.step(x, residuals[-1])
+        if residuals[-1] < epsilon:
+            return IterationResult(x, iteration, residuals, True)
+        z = precondition(r)
+        rz, rz_prev = r @ z, rz
+        p = z + (rz / rz_prev) * p
+    return IterationResult(x, max_iterations, residuals, False)
+
+
+@instrumented
+def gmres(a, b, epsilon=0.001, max_iterations=1000, x0: np.ndarray = None,
+          preconditioner: str | Callable = None, restart: int = 30,
+          monitor: Monitor | None = None) -> IterationResult:
+    """
+    Рассчитывает решение системы линейных уравнений методом GMRES(m) с перезапусками
+    и правым предобуславливанием (минимизируется невязка исходной системы).
+
+    Параметры:
+        a: Матрица коэффициентов (numpy, scipy.sparse), LinearOperator или функция v -> A v.
+        b (numpy.ndarray): Вектор правых частей системы линейных уравнений.
+        epsilon (float, опционально): Точность сходимости по относительной невязке. По умолчанию 0.001.
+        max_iterations (int, опционально): Максимальное общее количество итераций. По умолчанию 1000.
+        x0 (numpy.ndarray, опционально): Начальное приближение. По умолчанию нулевой вектор.
+        preconditioner (str | callable, опционально): "jacobi", "ssor", "ilu" или функция r -> M^-1 r.
+        restart (int, опционально): Размерность подпространства Крылова до перезапуска. По умолчанию 30.
+        monitor (Monitor, опционально): Монитор для сбора метрик (итерации, умножения матрицы
+            на вектор, невязки, время). По умолчанию None.
+
+    Возвращает:
+        IterationResult: решение, количество итераций, история невязок и признак сходимости.
+    """
+    from scipy.linalg import solve_triangular
+
+    op, b, x, precondition, b_norm = _setup(a, b, x0, preconditioner, monitor)
+    n = len(b)
+    r = b - op.matvec(x)
+    beta = np.linalg.norm(r)
+    # начальная невязка и по одной оценке |g_k| / ||b|| на итерацию; истинная невязка
+    # при перезапуске только проверяется, чтобы не дублировать записи в истории
+    residuals = [beta / b_norm]
+    iteration = 0
+    while True:
+        if beta / b_norm < epsilon:
+            return IterationResult(x, iteration, residuals, True)
+        if iteration >= max_iterations:
+            return IterationResult(x, iteration, residuals, False)
+
+        m = min(restart, max_iterations - iteration)
+        v = np.zeros((m + 1, n))  # ортонормированный базис подпространства Крылова
+        z = np.zeros((m, n))  # предобусловленные векторы базиса
+        h = np.zeros((m + 1, m))  # матрица Хессенберга
+        cs, sn = np.zeros(m), np.zeros(m)  # вращения Гивенса
+        g = np.zeros(m + 1)
+        g[0] = beta
+        v[0] = r / beta
+        k = 0
+        for j in range(m):
+            z[j] = precondition(v[j])
+            w = op.matvec(z[j])
+            for i in range(j + 1):  # модифицированный процесс Грама-Шмидта
+                h[i, j] = w @ v[i]
+                w -= h[i, j] * v[i]
+            h[j + 1, j] = np.linalg.norm(w)
+            breakdown = h[j + 1, j] == 0  # решение найдено точно в текущем подпространстве
+            if not breakdown:
+                v[j + 1] = w / h[j + 1, j]
+
+            for i in range(j):  # применение накопленных вращений к новому столбцу
+                h[i, j], h[i + 1, j] = (cs[i] * h[i, j] + sn[i] * h[i + 1, j],
+                                        -sn[i] * h[i, j] + cs[i] * h[i + 1, j])
+            denominator = np.hypot(h[j, j], h[j + 1, j])
+            cs[j], sn[j] = h[j, j] / denominator, h[j + 1, j] / denominator
+            h[j, j], h[j + 1, j] = denominator, 0.0
+            g[j], g[j + 1] = cs[j] * g[j], -sn[j] * g[j]
+
+            k = j + 1
+            iteration += 1
+            residuals.append(abs(g[k]) / b_norm)
+            if monitor is not None:
+                monitor.step(x, residuals[-1])
+            if residuals[-1] < epsilon or breakdown:
+                break
+
+        y = solve_triangular(h[:k, :k], g[:k], lower=False)
+        x += z[:k].T @ y
+        r = b - op.matvec(x)
+        beta = np.linalg.norm(r)
+
+
+@instrumented
+def bicgstab(a, b, epsilon=0.001, max_iterations=1000, x0: np.ndarray = None,
+             preconditioner: str | Callable = None, monitor: Monitor | None = None) -> IterationResult:
+    """
+    Рассчитывает решение системы линейных уравнений методом бисопряженных градиентов
+    со стабилизацией (BiCGSTAB) и правым предобуславливанием.
+
+    Параметры:
+        a: Матрица коэффициентов (numpy, scipy.sparse), LinearOperator или функция v -> A v.
+        b (numpy.ndarray): Вектор правых частей системы линейных уравнений.
+        epsilon (float, опционально): Точность сходимости по относительной невязке. По умолчанию 0.001.
+        max_iterations (int, опционально): Максимальное количество итераций. По умолчанию 1000.
+        x0 (numpy.ndarray, опционально): Начальное приближение. По умолчанию нулевой вектор.
+        preconditioner (str | callable, опционально): "jacobi", "ssor", "ilu" или функция r -> M^-1 r.
+        monitor (Monitor, опционально): Монитор для сбора метрик (итерации, умножения матрицы
+            на вектор, невязки, время). По умолчанию None.
+
+    Возвращает:
+        IterationResult: решение, количество итераций, история невязок и признак сходимости.
+    """
+    op, b, x, precondition, b_norm = _setup(a, b, x0, preconditioner, monitor)
+    r = b - op.matvec(x)
+    r_hat = r.copy()
+    residuals = [np.linalg.norm(r) / b_norm]
+    if residuals[-1] < epsilon:
+        return IterationResult(x, 0, residuals, True)
+
+    rho = alpha = omega = 1.0
+    v = p = np.zeros_like(b)
+    for iteration in range(1, max_iterations + 1):
+        rho, rho_prev = r_hat @ r, rho
+        if rho == 0:
+            raise ValueError("Метод BiCGSTAB прерван: вырождение (r_hat, r) = 0")
+        p = r + (rho / rho_prev) * (alpha / omega) * (p - omega * v)
+        p_hat = precondition(p)
+        v = op.matvec(p_hat)
+        alpha = rho / (r_hat @ v)
+        s = r - alpha * v
+        if np.linalg.norm(s) / b_norm < epsilon:
+            x += alpha * p_hat
+            residuals.append(np.linalg.norm(s) / b_norm)
+            if monitor is not None:
+                monitor.step(x, residuals[-1])
+            return IterationResult(x, iteration, residuals, True)
+        s_hat = precondition(s)
+        t = op.matvec(s_hat)
+        omega = (t @ s) / (t @ t)
+        x += alpha * p_hat + omega * s_hat
+        r = s - omega * t
+        residuals.append(np.linalg.norm(r) / b_norm)
+        if monitor is not None:
+            monitor.step(x, residuals[-1])
+        if residuals[-1] < epsilon:
+            return IterationResult(x, iteration, residuals, True)
+    return IterationResult(x, max_iterations, residuals, False)
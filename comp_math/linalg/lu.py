@@ -0,0 +1,192 @@
+import numpy as np
+
+from comp_math.instrumentation import Monitor, instrumented
+from comp_math.linalg.simple_iteration import IterationResult
+
+
+def _factor_panel(lu: np.ndarray, piv: np.ndarray, start: int, stop: int) -> None:
+    """
+    Выполняет исключение с выбором главного элемента по столбцам start..stop-1.
+
+    Перестановки применяются к строкам целиком, а обновление ранга 1 — только
+    к столбцам панели (остальная часть матрицы обновляется блочно).
+    """
+    n = len(lu)
+    for i in range(start, stop):
+        # нахождение индекса строки с максимальным абсолютным значением
+        max_row_index = np.abs(lu[i:, i]).argmax() + i
+        piv[i] = max_row_index
+        if lu[max_row_index, i] == 0:
+            raise ValueError("Матрица системы вырождена")
+
+        # перестановка строк
+        if i != max_row_index:
+            lu[[i, max_row_index]] = lu[[max_row_index, i]]
+
+        # множители исключения сохраняются на месте зануляемых элементов
+        lu[i + 1:, i] /= lu[i, i]
+        if i + 1 < stop and i + 1 < n:
+            lu[i + 1:, i + 1:stop] -= np.outer(lu[i + 1:, i], lu[i, i + 1:stop])
+
+
+def lu_factor(a: np.ndarray, overwrite: bool = False, block_size: int = 64,
+              dtype: type = float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Рассчитывает LU-разложение матрицы PA = LU с выбором главного элемента по столбцу.
+
+    Разложение выполняется на месте блоками по block_size столбцов: панель
+    раскладывается обновлениями ранга 1, затем остаток матрицы обновляется
+    одним матричным произведением.
+
+    Параметры:
+        a (numpy.ndarray): Квадратная матрица коэффициентов.
+        overwrite (bool): Разрешить использовать память матрицы a под результат.
+        block_size (int): Количество столбцов в блоке.
+        dtype (type): Тип элементов разложения. numpy.float32 вдвое сокращает память
+            и объем обрабатываемых данных ценой точности (см. iterative_refinement).
+
+    Возвращает:
+        lu (numpy.ndarray): Матрица, содержащая U в верхнем треугольнике и множители L
+            (без единичной диагонали) под диагональю.
+        piv (numpy.ndarray): Перестановки строк: на шаге i строка i менялась со строкой piv[i].
+    """
+    lu = np.asarray(a, dtype=dtype)
+    if not (overwrite and lu is a and lu.flags.writeable):
+        lu = lu.copy()
+    n = len(lu)
+    if lu.shape != (n, n):
+        raise ValueError("Матрица системы должна быть квадратной")
+
+    from scipy.linalg import solve_triangular  # scipy загружается при первом разложении
+
+    piv = np.zeros(n, dtype=int)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        _factor_panel(lu, piv, start, stop)
+        if stop < n:
+            # U12 = L11^-1 * A12, A22 = A22 - L21 * U12
+            lu[start:stop, stop:] = solve_triangular(lu[start:stop, start:stop], lu[start:stop, stop:],
+                                                     lower=True, unit_diagonal=True)
+            lu[stop:, stop:] -= lu[stop:, start:stop] @ lu[start:stop, stop:]
+    return lu, piv
+
+
+def lu_solve(lu_and_piv: tuple[np.ndarray, np.ndarray], b: np.ndarray) -> np.ndarray:
+    """
+    Рассчитывает решение системы по готовому LU-разложению
+    (в точности разложения: для разложения в float32 решение также в float32).
+
+    Параметры:
+        lu_and_piv (tuple): Результат lu_factor.
+        b (numpy.ndarray): Вектор правых частей или матрица, столбцы которой — правые части.
+
+    Возвращает:
+        x (numpy.ndarray): Решение той же формы, что и b.
+    """
+    from scipy.linalg import solve_triangular
+
+    lu, piv = lu_and_piv
+    y = np.array(b, dtype=lu.dtype)
+    for i, p in enumerate(piv):
+        if i != p:
+            y[[i, p]] = y[[p, i]]
+    y = solve_triangular(lu, y, lower=True, unit_diagonal=True, overwrite_b=True)
+    return solve_triangular(lu, y, lower=False, overwrite_b=True)
+
+
+@instrumented
+def iterative_refinement(a: np.ndarray, b: np.ndarray, lu_and_piv: tuple[np.ndarray, np.ndarray],
+                         max_iterations: int = 30, monitor: Monitor | None = None) -> IterationResult:
+    """
+    Уточняет решение системы, полученное по LU-разложению пониженной точности.
+
+    Невязка r = b - A x вычисляется в float64 по исходной матрице, поправка A d = r
+    находится по готовому разложению, и x += d накапливается в float64. Каждая итерация
+    уменьшает погрешность примерно в cond(A) * eps разложения раз, поэтому для разложения
+    в float32 уточнение сходится к точности float64 при cond(A) много меньше 10^7.
+    Итерации прекращаются, когда нормированная невязка ||b - A x|| / (||A|| ||x||)
+    становится меньше sqrt(n) * eps(float64), или признаются несошедшимися, если поправка
+    перестала уменьшаться хотя бы вдвое (матрица слишком плохо обусловлена).
+
+    Параметры:
+        a (numpy.ndarray): Матрица коэффициентов системы линейных уравнений.
+        b (numpy.ndarray): Вектор правых частей (или матрица, столбцы которой — правые части).
+        lu_and_piv (tuple): Результат lu_factor (например, с dtype=numpy.float32).
+        max_iterations (int, опционально): Максимальное количество итераций. По умолчанию 30.
+        monitor (Monitor, опционально): Монитор для сбора метрик (итерации, умножения матрицы
+            на вектор, невязки, время). По умолчанию None.
+
+    Возвращает:
+        IterationResult: решение в float64, количество итераций, история нормированных невязок
+            и признак сходимости.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    tolerance = np.sqrt(len(a)) * np.finfo(float).eps
+    a_norm = np.linalg.norm(a, np.inf)
+    x = lu_solve(lu_and_piv, b).astype(float)
+
+    residuals = []
+    correction = np.inf
+    for iteration in range(max_iterations + 1):
+        r = b - a @ x  # невязка в двойной точности
+        residuals.append(np.abs(r).max() / (a_norm * np.abs(x).max() or 1.0))
+        if monitor is not None:
+            monitor.matvecs += 1
+            if iteration:
+                monitor.step(x, residuals[-1])
+        if residuals[-1] <= tolerance:  # достигнута точность float64
+            return IterationResult(x, iteration, residuals, True)
+        if iteration == max_iterations:
+            break
+        d = lu_solve(lu_and_piv, r)
+        x += d
+        correction, previous = np.abs(d).max(), correction
+        if not correction <= previous / 2:  # поправка не уменьшается: уточнение не сходится
+            return IterationResult(x, iteration + 1, residuals, False)
+    return IterationResult(x, max_iterations, residuals, False)
+
+
+@instrumented
+def gauss(a: np.array, b: np.array, verbose: bool = False, precision: str = "double",
+          monitor: Monitor | None = None) -> np.ndarray:
+    """
+    Рассчитывает решение системы линейных уравнений с использованием метода Гаусса.
+
+    Параметры:
+        a (numpy.ndarray): Матрица коэффициентов системы линейных уравнений.
+        b (numpy.ndarray): Вектор правых частей системы линейных уравнений
+            (или матрица, столбцы которой — правые части).
+        verbose (bool): Выводить объединенную и треугольную матрицы системы (для учебных примеров).
+        precision (str): "double" — разложение в float64; "mixed" — разложение в float32
+            с итерационным уточнением решения до точности float64 (см. iterative_refinement).
+        monitor (Monitor, опционально): Монитор для учета времени работы. По умолчанию None.
+
+    Возвращает:
+        x (numpy.ndarray): Вектор решения системы линейных уравнений.
+    """
+    if precision not in ("double", "mixed"):
+        raise ValueError(f"Неизвестная точность: {precision}")
+    if verbose:
+        system = np.hstack([a, np.reshape(b, (len(a), -1))])
+        print(f"Объединенная матрица системы линейных уравнений:\n{system}")
+
+    lu, piv = lu_factor(a, dtype=np.float32 if precision == "mixed" else float)
+
+    if verbose:
+        from scipy.linalg import solve_triangular
+
+        # прямой ход метода Гаусса: U и преобразованные правые части L^-1 P b
+        y = np.array(b, dtype=float).reshape(len(a), -1)
+        for i, p in enumerate(piv):
+            y[[i, p]] = y[[p, i]]
+        y = solve_triangular(lu, y, lower=True, unit_diagonal=True)
+        print(f"Система приведена к треугольному виду:\n{np.hstack([np.triu(lu), y]).round(4)}")
+
+    if precision == "double":
+        return lu_solve((lu, piv), b)
+    result = iterative_refinement(a, b, (lu, piv))
+    if not result.converged:
+        raise ValueError("Итерационное уточнение не сходится: матрица системы слишком плохо обусловлена "
+                         "для разложения в одинарной точности")
+    return result.x
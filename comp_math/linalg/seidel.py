@@ -0,0 +1,211 @@
+import numpy as np
+
+from comp_math.instrumentation import Monitor, instrumented
+from comp_math.linalg.simple_iteration import IterationResult, is_sparse, split_diagonal
+
+
+def estimate_omega(a, iterations: int = 50) -> float:
+    """
+    Оценивает оптимальный параметр релаксации ω = 2 / (1 + sqrt(1 - ρ²)),
+    где ρ — спектральный радиус матрицы итераций метода Якоби D^-1 R
+    (оценивается степенным методом). Формула точна для согласованно упорядоченных матриц.
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов.
+        iterations (int): Количество итераций степенного метода.
+
+    Возвращает:
+        float: Оценка оптимального ω из интервала [1, 2).
+    """
+    d, r = split_diagonal(a)
+    v = np.random.default_rng(0).random(len(d))
+    rho = 0.0
+    for _ in range(iterations):
+        w = (r @ v) / d
+        rho = np.linalg.norm(w) / np.linalg.norm(v)
+        v = w / np.linalg.norm(w)
+    if rho >= 1:
+        return 1.0  # метод Якоби расходится, оценка неприменима
+    return 2 / (1 + np.sqrt(1 - rho ** 2))
+
+
+def sweep_solver(a, d: np.ndarray, omega: float, lower: bool = True) -> callable:
+    """
+    Строит решение треугольной системы прохода метода релаксации: прямого с матрицей
+    M = D / ω + L или обратного с матрицей M = D / ω + U.
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов.
+        d (numpy.ndarray): Диагональ матрицы (без нулевых элементов).
+        omega (float): Параметр релаксации.
+        lower (bool): Прямой (True) или обратный (False) проход.
+
+    Возвращает:
+        callable: Функция r -> M^-1 r.
+    """
+    if is_sparse(a):
+        import scipy.sparse as sps
+        from scipy.sparse.linalg import spsolve_triangular
+
+        triangle = sps.tril(a, k=-1, format="csr") if lower else sps.triu(a, k=1, format="csr")
+        m = triangle + sps.diags(d / omega, format="csr")
+        return lambda r: spsolve_triangular(m, r, lower=lower)
+    from scipy.linalg import solve_triangular
+
+    a = np.asarray(a, dtype=float)
+    m = (np.tril(a, k=-1) if lower else np.triu(a, k=1)) + np.diag(d / omega)
+    return lambda r: solve_triangular(m, r, lower=lower)
+
+
+def _parity_colors(rows: np.ndarray, cols: np.ndarray, n: int) -> np.ndarray | None:
+    """
+    Пытается получить красно-черное упорядочение по четности номера узла сетки.
+
+    Для трехдиагональных матриц и шаблонов на прямоугольных сетках (смещения 1, nx, nx * ny)
+    цвет узла — четность суммы его координат, i + i // nx + i // (nx * ny). Возвращает None,
+    если связанные неизвестные получили одинаковый цвет.
+    """
+    index = np.arange(n)
+    offsets = np.unique(np.abs(cols - rows))
+    colors = index % 2
+    for offset in offsets[offsets > 1][:3]:
+        if (colors[rows] != colors[cols]).all():
+            break
+        colors = (colors + index // offset) % 2
+    return colors if (colors[rows] != colors[cols]).all() else None
+
+
+def multicolor_ordering(a, max_colors: int = 64) -> list[np.ndarray]:
+    """
+    Разбивает неизвестные на группы (цвета) так, чтобы внутри группы уравнения не были связаны.
+
+    Сначала проверяется красно-черное упорядочение по четности номера узла (трехдиагональные
+    матрицы, пяти- и семиточечные шаблоны). Иначе граф матрицы раскрашивается векторизованным
+    алгоритмом Джонса-Плассмана: на каждом раунде неизвестные, вес которых больше весов всех
+    нераскрашенных соседей, одновременно получают наименьший цвет, не занятый соседями.
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов.
+        max_colors (int): Максимальное количество цветов. Для плотных матриц многоцветное
+            упорядочение теряет смысл (число цветов близко к n).
+
+    Возвращает:
+        list: Массивы индексов неизвестных каждого цвета.
+    """
+    if is_sparse(a):
+        graph = a.tocoo()
+        n, row, col = graph.shape[0], graph.row, graph.col
+        off_diagonal = (row != col) & (graph.data != 0)
+    else:
+        a = np.asarray(a)
+        n, (row, col) = len(a), np.nonzero(a)
+        off_diagonal = row != col
+    rows = np.concatenate([row[off_diagonal], col[off_diagonal]])  # граф симметризуется
+    cols = np.concatenate([col[off_diagonal], row[off_diagonal]])
+
+    colors = _parity_colors(rows, cols, n)
+    if colors is None:
+        weights = np.random.default_rng(0).permutation(n)  # различные веса
+        colors = np.full(n, -1)
+        while (uncolored := colors < 0).any():
+            # неизвестные с наибольшим весом среди нераскрашенных соседей образуют независимое множество
+            active = uncolored[rows] & uncolored[cols]
+            beaten = np.zeros(n, dtype=bool)
+            beaten[rows[active][weights[cols[active]] > weights[rows[active]]]] = True
+            chosen = np.flatnonzero(uncolored & ~beaten)
+
+            # наименьший цвет, не занятый уже раскрашенными соседями
+            position = np.full(n, -1)
+            position[chosen] = np.arange(len(chosen))
+            edges = (position[rows] >= 0) & (colors[cols] >= 0)
+            used = np.zeros((len(chosen), max_colors + 1), dtype=bool)
+            used[position[rows[edges]], np.minimum(colors[cols[edges]], max_colors)] = True
+            colors[chosen] = used.argmin(axis=1)
+            if colors.max() >= max_colors:
+                raise ValueError(f"Для многоцветного упорядочения нужно больше {max_colors} цветов: "
+                                 f"матрица слишком плотная, используйте естественный порядок")
+    return [np.flatnonzero(colors == c) for c in range(colors.max() + 1)]
+
+
+@instrumented
+def gauss_seidel(a, b, epsilon=0.001, max_iterations=1000, omega: float | str = 1.0,
+                 ordering: str = "natural", check_every: int = 1, x0: np.ndarray = None,
+                 colors: list[np.ndarray] | None = None, monitor: Monitor | None = None) -> IterationResult:
+    """
+    Рассчитывает решение системы линейных уравнений с использованием метода Гаусса-Зейделя
+    (метода последовательной верхней релаксации при ω != 1).
+
+    При естественном порядке итерация x_k+1 = x_k + (D / ω + L)^-1 (b - A x_k) выполняется
+    решением треугольной системы, а для проверки сходимости используется уже вычисленная
+    невязка b - A x_k (без дополнительного умножения матрицы на вектор; возвращаемое
+    приближение на одну итерацию точнее). При красно-черном (многоцветном) порядке
+    неизвестные одного цвета обновляются одновременно одной векторной операцией.
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов системы линейных уравнений.
+        b (numpy.ndarray): Вектор правых частей системы линейных уравнений.
+        epsilon (float, опционально): Точность сходимости по относительной невязке. По умолчанию 0.001.
+        max_iterations (int, опционально): Максимальное количество итераций. По умолчанию 1000.
+        omega (float | str, опционально): Параметр релаксации из (0, 2) или "auto" для оценки
+            оптимального значения. По умолчанию 1.0 (метод Гаусса-Зейделя).
+        ordering (str, опционально): Порядок обновления: "natural" или "red-black". По умолчанию "natural".
+        check_every (int, опционально): Проверять невязку раз в check_every итераций. По умолчанию 1.
+        x0 (numpy.ndarray, опционально): Начальное приближение. По умолчанию нулевой вектор.
+        colors (list, опционально): Готовое разбиение неизвестных на цвета (результат multicolor_ordering)
+            для повторных решений с той же матрицей. По умолчанию вычисляется при ordering="red-black".
+        monitor (Monitor, опционально): Монитор для сбора метрик (итерации, умножения матрицы
+            на вектор, невязки, время). По умолчанию None.
+
+    Возвращает:
+        IterationResult: решение, количество итераций, история невязок и признак сходимости.
+    """
+    if omega == "auto":
+        omega = estimate_omega(a)
+    if not 0 < omega < 2:
+        raise ValueError("Параметр релаксации должен лежать в интервале (0, 2)")
+    if ordering not in ("natural", "red-black"):
+        raise ValueError(f"Неизвестный порядок обновления: {ordering}")
+
+    sparse = is_sparse(a)
+    a = a.tocsr().astype(float) if sparse else np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(len(b)) if x0 is None else np.array(x0, dtype=float)  # начальное приближение
+    b_norm = np.linalg.norm(b) or 1.0
+    d = np.asarray(a.diagonal())
+    if np.any(d == 0):
+        raise ValueError("На диагонали матрицы есть нулевые элементы")
+
+    if ordering == "natural":
+        solve = sweep_solver(a, d, omega)  # M = D / ω + L
+
+        def sweep(x):
+            r = b - a @ x
+            x += solve(r)
+            return r  # невязка приближения до прохода
+    else:
+        if colors is None:
+            colors = multicolor_ordering(a)
+        # строки матрицы для каждого цвета выделяются один раз
+        blocks = [(idx, a[idx], b[idx], d[idx]) for idx in colors]
+
+        def sweep(x):
+            for idx, rows, b_c, d_c in blocks:
+                x[idx] += omega * (b_c - rows @ x) / d_c
+            return None
+
+    residuals = []
+    checked = 0
+    for iteration in range(1, max_iterations + 1):
+        r = sweep(x)
+        if iteration % check_every == 0 or iteration == max_iterations:
+            if r is None:
+                r = b - a @ x
+            residuals.append(np.linalg.norm(r) / b_norm)
+            if monitor is not None:
+                # каждый проход — одно умножение матрицы на вектор, отдельная проверка — еще одно
+                monitor.matvecs += iteration - checked + (ordering != "natural")
+                monitor.step(x, residuals[-1], iteration - checked)
+                checked = iteration
+            if residuals[-1] < epsilon:  # проверка на соответствие заданной точности
+                return IterationResult(x, iteration, residuals, True)
+    return IterationResult(x, max_iterations, residuals, False)
@@ -0,0 +1,105 @@
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from comp_math.instrumentation import Monitor, instrumented
+
+if TYPE_CHECKING:
+    import scipy.sparse as sps
+
+
+class IterationResult(NamedTuple):
+    """
+    Результат итерационного решения системы линейных уравнений.
+
+    Поля:
+        x (numpy.ndarray): Приближенное решение.
+        iterations (int): Количество выполненных итераций.
+        residuals (list): История норм невязки ||b - Ax|| / ||b|| по итерациям.
+        converged (bool): Достигнута ли заданная точность.
+        elapsed (float): Время работы метода в секундах.
+    """
+    x: np.ndarray
+    iterations: int
+    residuals: list[float]
+    converged: bool
+    elapsed: float = 0.0
+
+
+def is_sparse(a) -> bool:
+    """
+    Проверяет, является ли матрица разреженной матрицей scipy, не загружая scipy
+    (плотные матрицы обрабатываются только средствами numpy).
+    """
+    return hasattr(a, "tocsr")
+
+
+def split_diagonal(a) -> "tuple[np.ndarray, np.ndarray | sps.csr_matrix]":
+    """
+    Разделяет матрицу на диагональ и внедиагональную часть A = D + R.
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов.
+
+    Возвращает:
+        d (numpy.ndarray): Диагональные элементы.
+        r (numpy.ndarray | scipy.sparse.csr_matrix): Матрица без диагонали (того же вида, что и a).
+    """
+    d = np.asarray(a.diagonal(), dtype=float)
+    if np.any(d == 0):
+        raise ValueError("На диагонали матрицы есть нулевые элементы")
+    if is_sparse(a):
+        import scipy.sparse as sps
+
+        r = sps.csr_matrix(a, dtype=float, copy=True)
+        r.setdiag(0)
+        r.eliminate_zeros()
+    else:
+        r = np.array(a, dtype=float)
+        np.fill_diagonal(r, 0)
+    return d, r
+
+
+@instrumented
+def jacobi(a, b: np.ndarray, epsilon: float, max_iterations: int = 1000, x0: np.ndarray = None,
+           norm_ord: float = 2, monitor: Monitor | None = None) -> IterationResult:
+    """
+    Рассчитывает решение системы линейных уравнений с использованием метода Якоби.
+
+    Каждая итерация x_k+1 = D^-1 (b - R x_k) выполняется одним умножением матрицы на вектор;
+    в нем же вычисляется невязка текущего приближения b - A x_k = (b - R x_k) - D x_k.
+
+    Параметры:
+        a (numpy.ndarray | scipy.sparse): Матрица коэффициентов системы линейных уравнений
+            (разреженные матрицы приводятся к формату CSR).
+        b (numpy.ndarray): Вектор правых частей системы линейных уравнений.
+        epsilon (float): Точность сходимости по относительной невязке ||b - Ax|| / ||b||.
+        max_iterations (int, опционально): Максимальное количество итераций. По умолчанию 1000.
+        x0 (numpy.ndarray, опционально): Начальное приближение. По умолчанию нулевой вектор.
+        norm_ord (float, опционально): Порядок нормы невязки (2, numpy.inf, ...). По умолчанию 2.
+        monitor (Monitor, опционально): Монитор для сбора метрик (итерации, умножения матрицы
+            на вектор, невязки, время). По умолчанию None.
+
+    Возвращает:
+        IterationResult: решение, количество итераций, история невязок и признак сходимости.
+    """
+    d, r = split_diagonal(a)
+    inv_d = 1 / d  # D^-1 и внедиагональная часть вычисляются один раз
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(len(b)) if x0 is None else np.array(x0, dtype=float)
+    b_norm = np.linalg.norm(b, norm_ord) or 1.0
+
+    residuals = []
+    for iteration in range(max_iterations + 1):
+        rhs = b - r @ x
+        residuals.append(np.linalg.norm(rhs - d * x, norm_ord) / b_norm)
+        if monitor is not None:
+            monitor.matvecs += 1
+            if iteration:
+                monitor.step(x, residuals[-1])
+        if residuals[-1] < epsilon:  # проверка на соответствие заданной точности
+            return IterationResult(x, iteration, residuals, True)
+        if iteration == max_iterations:
+            break
+        x = rhs * inv_d  # вычисление значения нового вектора
+    return IterationResult(x, max_iterations, residuals, False)
@@ -0,0 +1,21 @@
+"""
+Численное интегрирование: составные, адаптивные, гауссовы, пакетные и потоковые квадратуры.
+
+Модули загружаются при первом обращении к экспортируемому из них имени.
+"""
+from comp_math._lazy import lazy_exports
+
+_EXPORTS = {
+    "func": "rules", "rectangular_rule": "rules", "trapezoidal_rule": "rules", "simpson_rule": "rules",
+    "QuadratureResult": "adaptive", "adaptive_quadrature": "adaptive",
+    "romberg": "romberg",
+    "gauss_legendre_nodes": "gauss", "gauss_kronrod_nodes": "gauss", "gauss_legendre": "gauss",
+    "gauss_kronrod": "gauss",
+    "unit_rule": "batch", "batch_integrate": "batch",
+    "iter_chunks": "streaming", "StreamingIntegrator": "streaming", "stream_cumulative": "streaming",
+    "stream_integral": "streaming",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
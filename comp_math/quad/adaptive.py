@@ -0,0 +1,112 @@
+import heapq
+import itertools
+import math
+from collections.abc import Callable
+from typing import NamedTuple
+
+import numpy as np
+
+from comp_math.expressions import as_function, tabulate
+from comp_math.instrumentation import Monitor, instrumented
+from comp_math.quad.rules import func, simpson_rule, trapezoidal_rule
+
+# правило, число его интервалов на панели и порядок точности
+_RULES = {
+    "simpson": (simpson_rule, 2, 4),
+    "trapezoid": (trapezoidal_rule, 1, 2),
+}
+
+
+class QuadratureResult(NamedTuple):
+    """
+    Результат адаптивного вычисления определенного интеграла.
+
+    Поля:
+        integral (float): Приближенное значение интеграла.
+        error (float): Оценка погрешности (сумма оценок по всем интервалам).
+        evaluations (int): Количество новых вычислений подынтегральной функции.
+        intervals (int): Количество интервалов итогового разбиения.
+        converged (bool): Достигнута ли заданная точность.
+        elapsed (float): Время работы метода в секундах.
+    """
+    integral: float
+    error: float
+    evaluations: int
+    intervals: int
+    converged: bool
+    elapsed: float = 0.0
+
+
+@instrumented
+def adaptive_quadrature(a: float, b: float, epsilon: float, func: Callable | str = func, rule: str = "simpson",
+                        cache: dict | None = None, max_intervals: int = 100_000,
+                        monitor: Monitor | None = None) -> QuadratureResult:
+    """
+    Вычисляет определенный интеграл с автоматическим выбором шага.
+
+    На каждом интервале правило применяется с шагом h и h / 2, а погрешность оценивается
+    по правилу Рунге: |I_h/2 - I_h| / (2^p - 1). Интервалы хранятся в очереди с приоритетом
+    по оценке погрешности, и делится пополам всегда интервал с наибольшей оценкой, пока
+    суммарная оценка не станет меньше epsilon. Узлы половин берутся из узлов родительского
+    интервала, а значения функции запоминаются, поэтому ни один узел не вычисляется дважды.
+
+    Аргументы:
+        a (float): Нижний предел интегрирования.
+        b (float): Верхний предел интегрирования.
+        epsilon (float): Требуемая точность.
+        func (callable | str): Подынтегральная функция (вычисляется для массивов) или запись выражения.
+        rule (str): Базовое правило: "simpson" или "trapezoid".
+        cache (dict | None): Словарь запомненных значений функции {x: f(x)}. Передача одного словаря
+            в несколько вызовов позволяет повторно использовать уже вычисленные значения.
+        max_intervals (int): Максимальное количество интервалов разбиения.
+        monitor (Monitor | None): Монитор для сбора метрик: итерацией считается деление интервала,
+            x — узлы разделенного интервала, невязка — суммарная оценка погрешности.
+
+    Возвращает:
+        QuadratureResult: значение интеграла, оценка погрешности, количество вычислений функции,
+            количество интервалов и признак сходимости.
+    """
+    if rule not in _RULES:
+        raise ValueError(f"Неизвестное правило: {rule}")
+    integrate, n, order = _RULES[rule]
+    runge = 2 ** order - 1
+    func = as_function(func)
+    if monitor is not None:
+        func = monitor.function(func)
+    cache = {} if cache is None else cache
+    evaluations = 0
+    counter = itertools.count()  # порядок добавления для интервалов с равной оценкой
+
+    def sample(x: np.ndarray) -> np.ndarray:
+        # значения в узлах; отсутствующие в кэше вычисляются одним векторным вызовом
+        nonlocal evaluations
+        missing = list(dict.fromkeys(xi for xi in x.tolist() if xi not in cache))
+        if missing:
+            cache.update(zip(missing, np.ravel(tabulate(func, missing)).tolist()))
+            evaluations += len(missing)
+        return np.array([cache[xi] for xi in x.tolist()])
+
+    def panel(x: np.ndarray) -> tuple:
+        # x — узлы интервала с шагом h; добавляются середины для шага h / 2
+        nodes = np.empty(2 * len(x) - 1)
+        nodes[::2] = x
+        nodes[1::2] = (x[:-1] + x[1:]) / 2
+        y = sample(nodes)
+        coarse = integrate(x[0], x[-1], func=y[::2])
+        fine = integrate(x[0], x[-1], func=y)
+        return -abs(fine - coarse) / runge, next(counter), nodes, fine
+
+    heap = [panel(np.linspace(a, b, n + 1))]
+    error = -heap[0][0]
+    while error > epsilon and len(heap) < max_intervals:
+        worst_error, _, nodes, _ = heapq.heappop(heap)
+        left, right = panel(nodes[:n + 1]), panel(nodes[n:])
+        heapq.heappush(heap, left)
+        heapq.heappush(heap, right)
+        error = max(error + worst_error - left[0] - right[0], 0.0)
+        if monitor is not None:
+            monitor.step(nodes, error)
+
+    error = -math.fsum(item[0] for item in heap)  # пересчет без накопленной ошибки округления
+    integral = math.fsum(item[3] for item in heap)
+    return QuadratureResult(integral, error, evaluations, len(heap), error <= epsilon)
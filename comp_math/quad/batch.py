@@ -0,0 +1,101 @@
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from comp_math.expressions import as_function
+from comp_math.quad.gauss import gauss_legendre_nodes
+from comp_math.quad.rules import func
+
+
+def unit_rule(rule: str, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Узлы и веса составной квадратурной формулы на отрезке [0, 1].
+
+    Параметры:
+        rule (str): "rectangle", "trapezoid", "simpson" или "gauss".
+        n (int): Количество интервалов разбиения (для "gauss" — количество узлов).
+
+    Возвращает:
+        tuple: узлы и веса; интеграл по [a, b] равен (b - a) * sum(w * f(a + (b - a) * t)).
+    """
+    if rule == "rectangle":
+        return (np.arange(n) + 0.5) / n, np.full(n, 1 / n)
+    if rule == "trapezoid":
+        w = np.full(n + 1, 1 / n)
+        w[[0, -1]] /= 2
+        return np.linspace(0, 1, n + 1), w
+    if rule == "simpson":
+        if n % 2 != 0:
+            raise ValueError("число n должно быть четным")
+        w = np.where(np.arange(n + 1) % 2 == 1, 4.0, 2.0) / (3 * n)
+        w[[0, -1]] = 1 / (3 * n)
+        return np.linspace(0, 1, n + 1), w
+    if rule == "gauss":
+        t, w = gauss_legendre_nodes(n)
+        return (t + 1) / 2, w / 2
+    raise ValueError(f"Неизвестное правило: {rule}")
+
+
+def _integrate_chunk(func: Callable | str, t: np.ndarray, w: np.ndarray, a: np.ndarray, b: np.ndarray,
+                     params: tuple) -> np.ndarray:
+    """
+    Вычисляет интегралы для части пакета: строит сетку узлов формы (chunk, nodes),
+    вычисляет функцию на всей сетке одним вызовом и сворачивает результат с весами.
+    """
+    length = b - a
+    x = a[:, None] + length[:, None] * t
+    y = as_function(func)(x, *(p[:, None] for p in params))
+    return length * (np.broadcast_to(y, x.shape) @ w)
+
+
+def batch_integrate(a, b, func: Callable | str = func, n: int = 10, rule: str = "gauss", params: tuple = (),
+                    chunk_size: int = 65536, processes: int | None = 1) -> np.ndarray:
+    """
+    Вычисляет множество определенных интегралов одной квадратурной формулой.
+
+    Пределы интегрирования и параметры подынтегральной функции приводятся к общей форме,
+    после чего для каждой части пакета строится двумерная сетка узлов, функция вычисляется
+    на ней одним векторным вызовом, а интегралы получаются сверткой с весами по оси узлов.
+    Пакет обрабатывается частями по chunk_size интегралов, поэтому дополнительная память
+    не зависит от размера пакета; части могут распределяться по процессам.
+
+    Параметры:
+        a (float | numpy.ndarray): Нижние пределы интегрирования.
+        b (float | numpy.ndarray): Верхние пределы интегрирования.
+        func (callable | str): Подынтегральная функция f(x, *params), вычисляемая для массивов,
+            или запись выражения (без параметров). Для пула процессов функция должна
+            сериализоваться модулем pickle (функция уровня модуля или строка).
+        n (int): Количество интервалов разбиения (для "gauss" — количество узлов).
+        rule (str): Квадратурная формула: "rectangle", "trapezoid", "simpson" или "gauss".
+        params (tuple): Массивы параметров подынтегральной функции, согласованные по форме с a и b.
+        chunk_size (int): Количество интегралов в одной части.
+        processes (int | None): Количество процессов. 1 — без пула процессов,
+            None — по числу ядер процессора.
+
+    Возвращает:
+        numpy.ndarray: значения интегралов формы, общей для a, b и params.
+    """
+    t, w = unit_rule(rule, n)
+    a, b, *params = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                        *(np.asarray(p, dtype=float) for p in params))
+    shape = a.shape
+    a, b = a.ravel(), b.ravel()
+    params = [p.ravel() for p in params]
+
+    integrals = np.empty(a.size)
+    bounds = [(start, min(start + chunk_size, a.size)) for start in range(0, a.size, chunk_size)]
+
+    if processes == 1 or len(bounds) <= 1:
+        for start, stop in bounds:
+            integrals[start:stop] = _integrate_chunk(func, t, w, a[start:stop], b[start:stop],
+                                                     tuple(p[start:stop] for p in params))
+    else:
+        with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+            chunks = executor.map(_integrate_chunk, *zip(*((func, t, w, a[start:stop], b[start:stop],
+                                                            tuple(p[start:stop] for p in params))
+                                                           for start, stop in bounds)))
+            for (start, stop), chunk in zip(bounds, chunks):
+                integrals[start:stop] = chunk
+    return integrals.reshape(shape)
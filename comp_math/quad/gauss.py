@@ -0,0 +1,216 @@
+import os
+from collections.abc import Callable
+
+import numpy as np
+
+from comp_math.expressions import as_function, tabulate
+from comp_math.instrumentation import Monitor, instrumented
+from comp_math.quad.rules import func
+
+
+def _legendre_recurrence(m: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Коэффициенты трехчленного рекуррентного соотношения для многочленов Лежандра
+    на [-1, 1]: alpha_k = 0, beta_0 = 2 (интеграл веса), beta_k = k^2 / (4k^2 - 1).
+    """
+    k = np.arange(m, dtype=float)
+    beta = np.empty(m)
+    beta[0] = 2.0
+    beta[1:] = k[1:] ** 2 / (4 * k[1:] ** 2 - 1)
+    return np.zeros(m), beta
+
+
+def _golub_welsch(alpha: np.ndarray, beta: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Узлы и веса квадратуры по алгоритму Голуба-Уэлша: узлы — собственные значения
+    трехдиагональной матрицы Якоби, веса — beta_0, умноженное на квадраты первых
+    компонент нормированных собственных векторов.
+    """
+    from scipy.linalg import eigh_tridiagonal  # scipy загружается при первом вычислении узлов
+
+    x, v = eigh_tridiagonal(alpha, np.sqrt(beta[1:]))
+    return x, beta[0] * v[0] ** 2
+
+
+def _kronrod_recurrence(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Коэффициенты рекуррентного соотношения для матрицы Якоби-Кронрода порядка 2n + 1
+    (алгоритм Лори).
+    """
+    alpha0, beta0 = _legendre_recurrence(2 * n + 2)
+    alpha, beta = np.zeros(2 * n + 1), np.zeros(2 * n + 1)
+    alpha[:3 * n // 2 + 1] = alpha0[:3 * n // 2 + 1]
+    beta[:-(-3 * n // 2) + 1] = beta0[:-(-3 * n // 2) + 1]
+    s, t = np.zeros(n // 2 + 2), np.zeros(n // 2 + 2)
+    t[1] = beta[n + 1]
+    for m in range(n - 1):
+        k = np.arange((m + 1) // 2, -1, -1)
+        l = m - k
+        s[k + 1] = np.cumsum((alpha[k + n + 1] - alpha[l]) * t[k + 1] + beta[k + n + 1] * s[k] - beta[l] * s[k + 1])
+        s, t = t, s
+    j = np.arange(n // 2, -1, -1)
+    s[j + 1] = s[j]
+    for m in range(n - 1, 2 * n - 2):
+        k = np.arange(m + 1 - n, (m - 1) // 2 + 1)
+        l = m - k
+        j = n - 1 - l
+        s[j + 1] = np.cumsum(-(alpha[k + n + 1] - alpha[l]) * t[j + 1] - beta[k + n + 1] * s[j + 1]
+                             + beta[l] * s[j + 2])
+        j, k = j[-1], (m + 1) // 2
+        if m % 2 == 0:
+            alpha[k + n + 1] = alpha[k] + (s[j + 1] - beta[k + n + 1] * s[j + 2]) / t[j + 2]
+        else:
+            beta[k + n + 1] = s[j + 1] / s[j + 2]
+        s, t = t, s
+    alpha[2 * n] = alpha[n - 1] - beta[2 * n] * s[1] / t[1]
+    return alpha, beta
+
+
+def _legendre(n: int, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Значения многочлена Лежандра P_n и его производной, вычисленные по рекуррентному соотношению.
+    """
+    p_prev, p = np.ones_like(x), x.copy()
+    for k in range(2, n + 1):
+        p_prev, p = p, ((2 * k - 1) * x * p - (k - 1) * p_prev) / k
+    return p, n * (x * p - p_prev) / (x ** 2 - 1)
+
+
+def _newton_refine(n: int, x: np.ndarray, steps: int = 2) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Уточняет корни многочлена Лежандра P_n методом Ньютона и вычисляет по ним
+    веса w_i = 2 / ((1 - x_i^2) P_n'(x_i)^2).
+    """
+    for _ in range(steps):
+        p, dp = _legendre(n, x)
+        x = x - p / dp
+    dp = _legendre(n, x)[1]
+    return x, 2 / ((1 - x ** 2) * dp ** 2)
+
+
+_NODES = {}  # кэш узлов и весов в памяти процесса: (имя, каталог) -> массивы
+
+
+def _load_or_compute(name: str, cache_dir: str | None, compute: Callable) -> tuple[np.ndarray, ...]:
+    """
+    Возвращает массивы из кэша в памяти или из файла name.npy в каталоге cache_dir,
+    а при их отсутствии вычисляет функцией compute и сохраняет. Массивы доступны только
+    для чтения, так как они разделяются всеми вызовами.
+    """
+    if (name, cache_dir) in _NODES:
+        return _NODES[name, cache_dir]
+    path = None if cache_dir is None else os.path.join(cache_dir, f"{name}.npy")
+    if path is not None and os.path.exists(path):
+        arrays = tuple(np.load(path))
+    else:
+        arrays = compute()
+        if path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.save(path, np.stack(arrays))
+    for array in arrays:
+        array.setflags(write=False)
+    _NODES[name, cache_dir] = arrays
+    return arrays
+
+
+def gauss_legendre_nodes(n: int, cache_dir: str | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Узлы и веса n-точечной квадратуры Гаусса-Лежандра на [-1, 1].
+
+    Начальные значения находятся алгоритмом Голуба-Уэлша и уточняются методом Ньютона.
+    Результат запоминается в памяти процесса и, если задан cache_dir, на диске.
+
+    Аргументы:
+        n (int): Количество узлов.
+        cache_dir (str | None): Каталог для хранения вычисленных узлов и весов.
+
+    Возвращает:
+        tuple: узлы и веса (массивы только для чтения).
+    """
+    if n < 1:
+        raise ValueError("Количество узлов должно быть положительным")
+    return _load_or_compute(f"gauss_legendre_{n}", cache_dir,
+                            lambda: _newton_refine(n, _golub_welsch(*_legendre_recurrence(n))[0]))
+
+
+def gauss_kronrod_nodes(n: int, cache_dir: str | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Узлы и веса пары квадратур Гаусса-Кронрода (n, 2n + 1) на [-1, 1].
+
+    Узлы Кронрода включают n узлов Гаусса, поэтому обе квадратуры вычисляются
+    по одним и тем же 2n + 1 значениям функции. Веса квадратуры Гаусса дополнены
+    нулями в узлах, добавленных Кронродом.
+
+    Аргументы:
+        n (int): Количество узлов квадратуры Гаусса.
+        cache_dir (str | None): Каталог для хранения вычисленных узлов и весов.
+
+    Возвращает:
+        tuple: узлы, веса квадратуры Кронрода и веса квадратуры Гаусса (массивы только для чтения).
+    """
+    if n < 1:
+        raise ValueError("Количество узлов должно быть положительным")
+
+    def compute():
+        x, kronrod_weights = _golub_welsch(*_kronrod_recurrence(n))
+        gauss_x, gauss_w = gauss_legendre_nodes(n, cache_dir)
+        x[1::2] = gauss_x  # узлы Гаусса чередуются с узлами Кронрода
+        gauss_weights = np.zeros_like(x)
+        gauss_weights[1::2] = gauss_w
+        return x, kronrod_weights, gauss_weights
+
+    return _load_or_compute(f"gauss_kronrod_{n}", cache_dir, compute)
+
+
+@instrumented
+def gauss_legendre(a: float, b: float, n: int, func: Callable | str = func, cache_dir: str | None = None,
+                   monitor: Monitor | None = None) -> float:
+    """
+    Вычисляет определенный интеграл по квадратурной формуле Гаусса-Лежандра,
+    точной для многочленов степени до 2n - 1.
+
+    Аргументы:
+        a (float): Нижний предел интегрирования.
+        b (float): Верхний предел интегрирования.
+        n (int): Количество узлов.
+        func (callable | str): Подынтегральная функция (вычисляется для массивов) или запись выражения.
+        cache_dir (str | None): Каталог для хранения вычисленных узлов и весов.
+        monitor (Monitor | None): Монитор для сбора метрик (вычисления функции, время).
+
+    Возвращает:
+        float: Приближенное значение определенного интеграла.
+    """
+    t, w = gauss_legendre_nodes(n, cache_dir)
+    if monitor is not None:
+        func = monitor.function(as_function(func))
+    # отображение узлов с [-1, 1] на [a, b]
+    y = tabulate(func, (b - a) / 2 * t + (a + b) / 2)
+    return float((b - a) / 2 * np.dot(w, y))
+
+
+@instrumented
+def gauss_kronrod(a: float, b: float, n: int = 7, func: Callable | str = func,
+                  cache_dir: str | None = None, monitor: Monitor | None = None) -> tuple[float, float]:
+    """
+    Вычисляет определенный интеграл по квадратурной формуле Кронрода с 2n + 1 узлами
+    и оценивает погрешность по отличию от формулы Гаусса, использующей часть тех же значений функции.
+
+    Аргументы:
+        a (float): Нижний предел интегрирования.
+        b (float): Верхний предел интегрирования.
+        n (int): Количество узлов квадратуры Гаусса. По умолчанию 7 (пара G7-K15).
+        func (callable | str): Подынтегральная функция (вычисляется для массивов) или запись выражения.
+        cache_dir (str | None): Каталог для хранения вычисленных узлов и весов.
+        monitor (Monitor | None): Монитор для сбора метрик (вычисления функции, время).
+
+    Возвращает:
+        integral (float): Приближенное значение интеграла по формуле Кронрода.
+        error (float): Оценка погрешности |K - G|.
+    """
+    t, kronrod_weights, gauss_weights = gauss_kronrod_nodes(n, cache_dir)
+    if monitor is not None:
+        func = monitor.function(as_function(func))
+    y = tabulate(func, (b - a) / 2 * t + (a + b) / 2)
+    kronrod = (b - a) / 2 * np.dot(kronrod_weights, y)
+    gauss = (b - a) / 2 * np.dot(gauss_weights, y)
+    return float(kronrod), float(abs(kronrod - gauss))
@@ -0,0 +1,60 @@
+from collections.abc import Callable
+
+import numpy as np
+
+from comp_math.expressions import as_function, tabulate
+from comp_math.instrumentation import Monitor, instrumented
+from comp_math.quad.adaptive import QuadratureResult
+from comp_math.quad.rules import func, trapezoidal_rule
+
+
+@instrumented
+def romberg(a: float, b: float, epsilon: float, func: Callable | str = func, max_levels: int = 20,
+            monitor: Monitor | None = None) -> QuadratureResult:
+    """
+    Вычисляет определенный интеграл методом Ромберга.
+
+    Шаг формулы трапеций последовательно делится пополам: старые узлы остаются узлами
+    нового разбиения, поэтому на уровне k функция вычисляется только в 2^(k-1) новых
+    серединах, а T_k = T_k-1 / 2 + h * sum(f(x_середин)). По значениям T_k строится строка
+    таблицы экстраполяции Ричардсона
+        R_k,j = R_k,j-1 + (R_k,j-1 - R_k-1,j-1) / (4^j - 1),
+    и вычисления прекращаются, когда диагональные элементы таблицы отличаются меньше чем на epsilon.
+
+    Аргументы:
+        a (float): Нижний предел интегрирования.
+        b (float): Верхний предел интегрирования.
+        epsilon (float): Требуемая точность.
+        func (callable | str): Подынтегральная функция (вычисляется для массивов) или запись выражения.
+        max_levels (int): Максимальное количество делений шага пополам.
+        monitor (Monitor | None): Монитор для сбора метрик: итерацией считается деление шага пополам,
+            x — диагональный элемент таблицы Ричардсона.
+
+    Возвращает:
+        QuadratureResult: значение интеграла, оценка погрешности, количество вычислений функции,
+            количество интервалов последнего разбиения и признак сходимости.
+    """
+    func = as_function(func)
+    if monitor is not None:
+        func = monitor.function(func)
+    row = [trapezoidal_rule(a, b, func=tabulate(func, [a, b]))]  # T_0 по концам отрезка
+    evaluations = 2
+    error = float("inf")
+
+    for level in range(1, max_levels + 1):
+        n = 2 ** level
+        h = (b - a) / n  # шаг
+        midpoints = tabulate(func, np.linspace(a + h, b - h, n // 2))  # только новые узлы
+        evaluations += n // 2
+
+        # новая строка таблицы Ричардсона по предыдущей
+        new_row = [row[0] / 2 + h * float(np.sum(midpoints))]
+        for j in range(1, level + 1):
+            new_row.append(new_row[j - 1] + (new_row[j - 1] - row[j - 1]) / (4 ** j - 1))
+        error = abs(new_row[-1] - row[-1])
+        row = new_row
+        if monitor is not None:
+            monitor.step(row[-1], error)
+        if error < epsilon:  # проверка на соответствие заданной точности
+            return QuadratureResult(row[-1], error, evaluations, n, True)
+    return QuadratureResult(row[-1], error, evaluations, 2 ** max_levels, False)
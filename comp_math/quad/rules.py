@@ -0,0 +1,124 @@
+from collections.abc import Callable
+
+import numpy as np
+
+from comp_math.expressions import as_function, tabulate
+from comp_math.instrumentation import Monitor, instrumented
+
+
+def func(x):
+    return np.log10(x ** 2 + 1) / x  # подынтегральная функция (вычисляется и для массивов)
+
+
+@instrumented
+def rectangular_rule(a: float, b: float, n: int | None = None, func: Callable | str | np.ndarray = func,
+                     monitor: Monitor | None = None) -> float:
+    """
+    Вычисляет определенный интеграл функции с использованием метода центральных прямоугольников.
+
+    Все средние точки Xi-1/2 строятся одним вызовом numpy.linspace, и функция вычисляется
+    в них одним векторным вызовом.
+
+    Аргументы:
+        a (float): Нижний предел интегрирования.
+        b (float): Верхний предел интегрирования.
+        n (int | None): Количество интервалов, на которые разбивается область интегрирования.
+            Для заранее вычисленных значений определяется по их количеству.
+        func (callable | str | numpy.ndarray): Подынтегральная функция, запись выражения или
+            значения функции в серединах n интервалов (например, numpy.memmap с измерениями).
+        monitor (Monitor | None): Монитор для сбора метрик (вычисления функции, время).
+
+    Возвращает:
+        float: Приближенное значение определенного интеграла.
+    """
+    if isinstance(func, str) or callable(func):
+        if monitor is not None:
+            func = monitor.function(as_function(func))
+        h = (b - a) / n  # шаг
+        # средние точки Xi-1/2 всех интервалов
+        y = tabulate(func, np.linspace(a + h / 2, b - h / 2, n))
+    else:
+        y = func  # заранее вычисленные значения не копируются
+        if n is not None and len(y) != n:
+            raise ValueError("количество значений функции должно быть равно n")
+        h = (b - a) / len(y)
+    return float(h * np.sum(y))
+
+
+@instrumented
+def trapezoidal_rule(a: float, b: float, n: int | None = None, func: Callable | str | np.ndarray = func,
+                     monitor: Monitor | None = None) -> float:
+    """
+       Вычисляет определенный интеграл функции с использованием метода трапеций.
+
+       Все узлы строятся одним вызовом numpy.linspace, функция вычисляется в них одним
+       векторным вызовом, а веса 1/2, 1, ..., 1, 1/2 применяются суммированием массива.
+
+       Аргументы:
+           a (float): Нижний предел интегрирования.
+           b (float): Верхний предел интегрирования.
+           n (int | None): Количество интервалов, на которые разбивается область интегрирования.
+               Для заранее вычисленных значений определяется по их количеству.
+           func (callable | str | numpy.ndarray): Подынтегральная функция, запись выражения или
+               значения функции в n + 1 равноотстоящих узлах (например, numpy.memmap с измерениями).
+           monitor (Monitor | None): Монитор для сбора метрик (вычисления функции, время).
+
+       Возвращает:
+           float: Приближенное значение определенного интеграла.
+       """
+    if isinstance(func, str) or callable(func):
+        if monitor is not None:
+            func = monitor.function(as_function(func))
+        y = tabulate(func, np.linspace(a, b, n + 1))
+    else:
+        y = func  # заранее вычисленные значения не копируются
+        if n is not None and len(y) != n + 1:
+            raise ValueError("количество значений функции должно быть равно n + 1")
+        n = len(y) - 1
+    h = (b - a) / n  # шаг
+
+    # первое и последнее значение делятся на 2, остальные прибавляются без изменений
+    integral = np.sum(y) - (y[0] + y[-1]) / 2
+    return float(integral * h)  # умножение на шаг
+
+
+@instrumented
+def simpson_rule(a: float, b: float, n: int | None = None, func: Callable | str | np.ndarray = func,
+                 monitor: Monitor | None = None) -> float:
+    """
+        Вычисляет определенный интеграл функции с использованием правила Симпсона.
+
+        Все узлы строятся одним вызовом numpy.linspace, функция вычисляется в них одним
+        векторным вызовом, а веса 1, 4, 2, 4, ..., 2, 4, 1 применяются суммированием
+        срезов с нечетными и четными индексами.
+
+        Параметры:
+            a (float): Нижний предел интегрирования.
+            b (float): Верхний предел интегрирования.
+            n (int | None): Количество подинтервалов. Должно быть четным числом.
+                Для заранее вычисленных значений определяется по их количеству.
+            func (callable | str | numpy.ndarray): Подынтегральная функция, запись выражения или
+                значения функции в n + 1 равноотстоящих узлах (например, numpy.memmap с измерениями).
+            monitor (Monitor | None): Монитор для сбора метрик (вычисления функции, время).
+
+        Возвращает:
+            float: Приближенное значение определенного интеграла.
+        """
+    if isinstance(func, str) or callable(func):
+        if monitor is not None:
+            func = monitor.function(as_function(func))
+        if n % 2 != 0:
+            raise ValueError("число n должно быть четным")
+        y = tabulate(func, np.linspace(a, b, n + 1))
+    else:
+        y = func  # заранее вычисленные значения не копируются
+        if n is not None and len(y) != n + 1:
+            raise ValueError("количество значений функции должно быть равно n + 1")
+        n = len(y) - 1
+        if n % 2 != 0:
+            raise ValueError("число n должно быть четным")
+    h = (b - a) / n  # шаг
+
+    # первое и последнее значения без множителя, нечетные индексы с множителем 4, четные — 2
+    integral = y[0] + y[-1] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-1:2])
+    return float(integral * h / 3)  # умножаем полученную сумму на коэффициент (шаг деленный на 3)
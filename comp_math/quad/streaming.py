@@ -0,0 +1,161 @@
+import os
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+
+def iter_chunks(source: str | os.PathLike | np.ndarray | Iterable, chunk_size: int = 2 ** 20,
+                dtype: type = float, offset: int = 0) -> Iterator[np.ndarray]:
+    """
+    Выдает отсчеты сигнала блоками, не загружая весь набор данных в память.
+
+    Аргументы:
+        source: Путь к файлу .npy (открывается через numpy.load с mmap_mode="r"), путь к двоичному
+            файлу без заголовка (открывается через numpy.memmap), одномерный массив (в том числе
+            numpy.memmap) или итерируемый объект (например, генератор), выдающий блоки отсчетов.
+        chunk_size (int): Количество отсчетов в блоке при чтении файла или массива.
+        dtype (type): Тип отсчетов в двоичном файле без заголовка.
+        offset (int): Смещение первого отсчета в двоичном файле в байтах.
+
+    Возвращает:
+        Iterator[numpy.ndarray]: Блоки отсчетов в float64.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if os.fspath(source).endswith(".npy"):
+            source = np.load(source, mmap_mode="r")
+        else:
+            source = np.memmap(source, dtype=dtype, mode="r", offset=offset)
+    if isinstance(source, np.ndarray):
+        if source.ndim != 1:
+            raise ValueError("Отсчеты должны образовывать одномерный массив")
+        for start in range(0, len(source), chunk_size):
+            yield np.asarray(source[start:start + chunk_size], dtype=float)  # в памяти только один блок
+    else:
+        for chunk in source:
+            yield np.asarray(chunk, dtype=float).ravel()
+
+
+class StreamingIntegrator:
+    """
+    Составная формула трапеций или Симпсона для отсчетов, поступающих блоками.
+
+    Между блоками хранятся только последний отсчет (формула трапеций) или отсчеты
+    после последнего четного узла (формула Симпсона), поэтому веса применяются так же,
+    как к целому массиву, а объем памяти не зависит от количества отсчетов.
+
+    Атрибуты:
+        h (float): Шаг между отсчетами.
+        rule (str): Правило: "trapezoid" или "simpson".
+        integral (float): Интеграл по всем завершенным интервалам (для формулы Симпсона —
+            по парам интервалов).
+        samples (int): Количество полученных отсчетов.
+    """
+
+    def __init__(self, h: float, rule: str = "trapezoid"):
+        """
+        Аргументы:
+            h (float): Шаг между отсчетами.
+            rule (str): Правило: "trapezoid" или "simpson".
+        """
+        if rule not in ("trapezoid", "simpson"):
+            raise ValueError(f"Неизвестное правило: {rule}")
+        self.h = h
+        self.rule = rule
+        self.integral = 0.0
+        self.samples = 0
+        self._tail = np.empty(0)  # отсчеты, не вошедшие в завершенные интервалы
+
+    def _panels(self, y: np.ndarray) -> np.ndarray:
+        # значения интеграла по интервалам (парам интервалов), завершенным блоком y
+        y = np.asarray(y, dtype=float).ravel()
+        self.samples += len(y)
+        y = np.concatenate([self._tail, y])
+        if self.rule == "trapezoid":
+            self._tail = y[-1:]
+            return (y[:-1] + y[1:]) * (self.h / 2)
+        # пары интервалов с весами 1, 4, 1; отсчеты после последнего четного узла ждут следующего блока
+        k = max((len(y) - 1) // 2, 0)
+        even, odd = y[0:2 * k + 1:2], y[1:2 * k:2]
+        self._tail = y[2 * k:]
+        return (even[:-1] + 4 * odd + even[1:]) * (self.h / 3)
+
+    def update(self, y: np.ndarray) -> float:
+        """
+        Добавляет блок отсчетов.
+
+        Аргументы:
+            y (numpy.ndarray): Очередные отсчеты сигнала.
+
+        Возвращает:
+            float: Интеграл по всем завершенным интервалам.
+        """
+        self.integral += float(np.sum(self._panels(y)))
+        return self.integral
+
+    def update_cumulative(self, y: np.ndarray) -> np.ndarray:
+        """
+        Добавляет блок отсчетов и возвращает накопленный интеграл в узлах, завершенных этим блоком.
+
+        Аргументы:
+            y (numpy.ndarray): Очередные отсчеты сигнала.
+
+        Возвращает:
+            numpy.ndarray: Значения интеграла от первого отсчета до каждого завершенного узла
+                (для формулы трапеций — каждого узла, для формулы Симпсона — каждого четного).
+        """
+        panels = self._panels(y)
+        cumulative = np.cumsum(panels) + self.integral
+        self.integral += float(np.sum(panels))  # попарное суммирование точнее накопленной суммы
+        return cumulative
+
+    def result(self) -> float:
+        """
+        Возвращает значение интеграла по всем полученным отсчетам.
+        """
+        if self.rule == "simpson" and len(self._tail) > 1:
+            raise ValueError("число n должно быть четным")
+        return self.integral
+
+
+def stream_cumulative(source: str | os.PathLike | np.ndarray | Iterable, h: float, rule: str = "trapezoid",
+                      chunk_size: int = 2 ** 20, dtype: type = float, offset: int = 0) -> Iterator[np.ndarray]:
+    """
+    Вычисляет накопленный интеграл сигнала по мере чтения отсчетов.
+
+    Аргументы:
+        source: Источник отсчетов (см. iter_chunks).
+        h (float): Шаг между отсчетами.
+        rule (str): Правило: "trapezoid" или "simpson".
+        chunk_size (int): Количество отсчетов в блоке при чтении файла или массива.
+        dtype (type): Тип отсчетов в двоичном файле без заголовка.
+        offset (int): Смещение первого отсчета в двоичном файле в байтах.
+
+    Возвращает:
+        Iterator[numpy.ndarray]: Для каждого блока — накопленные значения интеграла от первого отсчета
+            до узлов, завершенных блоком (для формулы Симпсона — только четных узлов).
+    """
+    integrator = StreamingIntegrator(h, rule)
+    for chunk in iter_chunks(source, chunk_size, dtype, offset):
+        yield integrator.update_cumulative(chunk)
+
+
+def stream_integral(source: str | os.PathLike | np.ndarray | Iterable, h: float, rule: str = "trapezoid",
+                    chunk_size: int = 2 ** 20, dtype: type = float, offset: int = 0) -> float:
+    """
+    Вычисляет интеграл сигнала, читая отсчеты блоками с постоянным расходом памяти.
+
+    Аргументы:
+        source: Источник отсчетов (см. iter_chunks).
+        h (float): Шаг между отсчетами.
+        rule (str): Правило: "trapezoid" или "simpson" (количество интервалов должно быть четным).
+        chunk_size (int): Количество отсчетов в блоке при чтении файла или массива.
+        dtype (type): Тип отсчетов в двоичном файле без заголовка.
+        offset (int): Смещение первого отсчета в двоичном файле в байтах.
+
+    Возвращает:
+        float: Приближенное значение интеграла по всем отсчетам.
+    """
+    integrator = StreamingIntegrator(h, rule)
+    for chunk in iter_chunks(source, chunk_size, dtype, offset):
+        integrator.update(chunk)
+    return integrator.result()
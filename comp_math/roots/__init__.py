@@ -0,0 +1,23 @@
+"""
+Решение нелинейных уравнений: отделение корней, уточнение корней и пакетные методы.
+
+Модули загружаются при первом обращении к экспортируемому из них имени.
+"""
+from comp_math._lazy import lazy_exports
+
+_EXPORTS = {
+    "evaluate_on_grid": "brackets", "iter_brackets": "brackets", "find_brackets": "brackets",
+    "step_method": "brackets",
+    "bisection_method": "bisection",
+    "RootResult": "newton", "Dual": "newton", "symbolic_derivatives": "newton", "dual_derivatives": "newton",
+    "derivative_functions": "newton", "newton_method": "newton", "secant_method": "newton",
+    "halley_method": "newton",
+    "relaxation": "simple_iteration", "fixed_point_iteration": "simple_iteration",
+    "batch_fixed_point": "simple_iteration", "simple_iteration_method": "simple_iteration",
+    "BatchResult": "batch", "polyval_rows": "batch", "polyder_rows": "batch", "batch_bisection": "batch",
+    "batch_newton": "batch", "batch_illinois": "batch",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
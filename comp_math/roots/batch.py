@@ -0,0 +1,264 @@
+from collections.abc import Callable
+from typing import NamedTuple
+
+import numpy as np
+
+from comp_math.expressions import as_function
+from comp_math.roots.brackets import evaluate_on_grid
+
+
+class BatchResult(NamedTuple):
+    """
+    Результат пакетного решения уравнений.
+
+    Поля:
+        roots: Массив приближенных значений корней (по одному на каждую задачу).
+        converged: Булев массив признаков сходимости для каждой задачи.
+        iterations: Массив количества итераций, выполненных для каждой задачи.
+    """
+    roots: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+
+
+def polyval_rows(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет значения многочленов схемой Горнера: i-й многочлен в точке x[i].
+
+    Параметры:
+        coefficients: Матрица коэффициентов формы (N, степень + 1), от старшего к младшему.
+        x: Массив точек формы (N,).
+
+    Возвращаемое значение:
+        Массив значений многочленов формы (N,).
+    """
+    y = np.zeros_like(x, dtype=float)
+    for c in coefficients.T:
+        y = y * x + c
+    return y
+
+
+def polyder_rows(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет коэффициенты производных для набора многочленов.
+
+    Параметры:
+        coefficients: Матрица коэффициентов формы (N, степень + 1), от старшего к младшему.
+
+    Возвращаемое значение:
+        Матрица коэффициентов производных формы (N, степень).
+    """
+    degree = coefficients.shape[1] - 1
+    return coefficients[:, :-1] * np.arange(degree, 0, -1)
+
+
+def _broadcast_lanes(func: Callable | str | np.ndarray, *values) -> list[np.ndarray]:
+    """
+    Приводит концы отрезков или начальные приближения к общей форме (N,) с учетом
+    количества наборов коэффициентов: скалярные значения повторяются для каждой задачи.
+    Возвращаются копии, которые можно изменять.
+    """
+    arrays = [np.atleast_1d(np.asarray(value, dtype=float)).ravel() for value in values]
+    if not (isinstance(func, str) or callable(func)):
+        arrays.append(np.empty(len(np.atleast_2d(np.asarray(func, dtype=float)))))
+    try:
+        arrays = np.broadcast_arrays(*arrays)
+    except ValueError:
+        raise ValueError("Количество наборов коэффициентов не совпадает с количеством задач") from None
+    return [array.copy() for array in arrays[:len(values)]]
+
+
+def _lane_function(func: Callable | str | np.ndarray, n: int) -> callable:
+    """
+    Приводит функцию или матрицу коэффициентов к виду evaluate(x, lanes),
+    вычисляющему значения только для задач с индексами lanes.
+    """
+    if isinstance(func, str) or callable(func):
+        func = as_function(func)
+        return lambda x, lanes: evaluate_on_grid(func, x)
+    coefficients = np.atleast_2d(np.asarray(func, dtype=float))
+    if len(coefficients) == 1:
+        coefficients = np.repeat(coefficients, n, axis=0)
+    if len(coefficients) != n:
+        raise ValueError("Количество наборов коэффициентов не совпадает с количеством задач")
+    return lambda x, lanes: polyval_rows(coefficients[lanes], x)
+
+
+def _start_brackets(a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray) -> tuple:
+    """
+    Начальное состояние пакетных методов на отрезках: задачи с корнем на конце отрезка
+    сразу считаются сошедшимися (корень — этот конец), задачи без смены знака на концах
+    помечаются несошедшимися с корнем nan. Возвращает (x, converged, active).
+    """
+    at_a, at_b = fa == 0, (fb == 0) & (fa != 0)
+    valid = np.sign(fa) * np.sign(fb) < 0
+    x = np.where(valid, (a + b) / 2, np.nan)
+    x[at_a], x[at_b] = a[at_a], b[at_b]
+    return x, at_a | at_b, np.flatnonzero(valid)
+
+
+def batch_bisection(func: Callable | str | np.ndarray, a: np.ndarray, b: np.ndarray, epsilon: float,
+                    max_iterations: int = 200) -> BatchResult:
+    """
+    Реализует метод половинного деления одновременно для N отрезков [a_i, b_i].
+
+    На каждой итерации функция вычисляется один раз в серединах отрезков, и только
+    для задач, которые еще не сошлись. Значения на левых концах хранятся между итерациями.
+
+    Параметры:
+        func: Функция f(x), принимающая массив numpy, запись выражения или матрица
+            коэффициентов многочленов формы (N, степень + 1) — тогда i-я задача решается
+            для i-го многочлена.
+        a: Массив начал отрезков (или одно число для всех задач).
+        b: Массив концов отрезков (или одно число для всех задач).
+        epsilon: Точность решения (по значению |f(x)|).
+        max_iterations: Максимальное количество итераций.
+
+    Возвращаемое значение:
+        BatchResult с корнями, признаками сходимости и количеством итераций.
+        Если функция обращается в нуль на конце отрезка, корнем считается этот конец;
+        задачи без смены знака на концах отрезка помечаются несошедшимися с корнем nan.
+    """
+    a, b = _broadcast_lanes(func, a, b)
+    n = a.size
+    evaluate = _lane_function(func, n)
+    lanes = np.arange(n)
+
+    fa = evaluate(a, lanes).copy()
+    fb = evaluate(b, lanes)
+    x, converged, active = _start_brackets(a, b, fa, fb)
+    iterations = np.zeros(n, dtype=int)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        xa = (a[active] + b[active]) / 2
+        fx = evaluate(xa, active)
+        x[active] = xa
+        iterations[active] += 1
+
+        done = np.abs(fx) < epsilon
+        converged[active[done]] = True
+
+        # сохраняем ту половину отрезка, на концах которой функция меняет знак
+        left = np.sign(fx) * np.sign(fa[active]) < 0
+        b[active[left]] = xa[left]
+        right = ~left
+        a[active[right]] = xa[right]
+        fa[active[right]] = fx[right]
+
+        active = active[~done]
+    return BatchResult(x, converged, iterations)
+
+
+def batch_newton(func: Callable | str | np.ndarray, x0: np.ndarray, epsilon: float, dfunc: callable = None,
+                 max_iterations: int = 50) -> BatchResult:
+    """
+    Реализует метод Ньютона одновременно для N начальных приближений.
+
+    Параметры:
+        func: Функция f(x), принимающая массив numpy, запись выражения
+            или матрица коэффициентов многочленов.
+        x0: Массив начальных приближений (или одно число для всех задач).
+        epsilon: Точность решения (по значению |f(x)|).
+        dfunc: Производная f'(x). Для многочленов и записей выражений строится автоматически.
+        max_iterations: Максимальное количество итераций.
+
+    Возвращаемое значение:
+        BatchResult с корнями, признаками сходимости и количеством итераций.
+        Задачи, в которых производная обратилась в ноль, помечаются как несошедшиеся.
+    """
+    x, = _broadcast_lanes(func, x0)
+    n = x.size
+    evaluate = _lane_function(func, n)
+    if isinstance(func, str) or callable(func):
+        func = as_function(func)
+        if dfunc is None and hasattr(func, "derivative"):
+            dfunc = func.derivative()  # производная скомпилированного выражения
+        if dfunc is None:
+            raise ValueError("Для произвольной функции необходимо задать производную dfunc")
+        derivative = _lane_function(dfunc, n)
+    else:
+        derivative = _lane_function(polyder_rows(np.atleast_2d(np.asarray(func, dtype=float))), n)
+
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=int)
+    active = np.arange(n)
+    for _ in range(max_iterations):
+        xa = x[active]
+        fx = evaluate(xa, active)
+        done = np.abs(fx) < epsilon
+        converged[active[done]] = True
+
+        dfx = derivative(xa, active)
+        stalled = dfx == 0  # касательная параллельна оси абсцисс
+        step = ~done & ~stalled
+        x[active[step]] = xa[step] - fx[step] / dfx[step]
+        iterations[active[step]] += 1
+
+        active = active[step]
+        if active.size == 0:
+            break
+    return BatchResult(x, converged, iterations)
+
+
+def batch_illinois(func: Callable | str | np.ndarray, a: np.ndarray, b: np.ndarray, epsilon: float,
+                   max_iterations: int = 100) -> BatchResult:
+    """
+    Реализует модифицированный метод хорд (метод Иллинойса) одновременно для N отрезков.
+
+    Метод сохраняет отрезок, содержащий корень, как метод половинного деления, но
+    сходится сверхлинейно. Если один конец отрезка сохраняется две итерации подряд,
+    значение функции на нем делится пополам. Если точка метода хорд не попадает строго
+    внутрь отрезка, выполняется шаг половинного деления.
+
+    Параметры:
+        func: Функция f(x), принимающая массив numpy, запись выражения
+            или матрица коэффициентов многочленов.
+        a: Массив начал отрезков (или одно число для всех задач).
+        b: Массив концов отрезков (или одно число для всех задач).
+        epsilon: Точность решения (по значению |f(x)|).
+        max_iterations: Максимальное количество итераций.
+
+    Возвращаемое значение:
+        BatchResult с корнями, признаками сходимости и количеством итераций.
+        Если функция обращается в нуль на конце отрезка, корнем считается этот конец;
+        задачи без смены знака на концах отрезка помечаются несошедшимися с корнем nan.
+    """
+    a, b = _broadcast_lanes(func, a, b)
+    n = a.size
+    evaluate = _lane_function(func, n)
+    lanes = np.arange(n)
+
+    fa = evaluate(a, lanes).copy()
+    fb = evaluate(b, lanes).copy()
+    x, converged, active = _start_brackets(a, b, fa, fb)
+    side = np.zeros(n, dtype=int)  # какой конец заменялся на прошлой итерации: -1 левый, 1 правый
+    iterations = np.zeros(n, dtype=int)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        aa, ba, faa, fba = a[active], b[active], fa[active], fb[active]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xa = ba - fba * (ba - aa) / (fba - faa)
+        inside = (xa > aa) & (xa < ba)
+        xa = np.where(inside, xa, (aa + ba) / 2)
+
+        fx = evaluate(xa, active)
+        x[active] = xa
+        iterations[active] += 1
+
+        done = np.abs(fx) < epsilon
+        converged[active[done]] = True
+
+        left = np.sign(fx) * np.sign(faa) < 0  # корень на [a, x]: заменяем правый конец
+        right = ~left
+
+        li, ri = active[left], active[right]
+        b[li], fb[li] = xa[left], fx[left]
+        fa[li] = np.where(side[li] == 1, fa[li] / 2, fa[li])
+        a[ri], fa[ri] = xa[right], fx[right]
+        fb[ri] = np.where(side[ri] == -1, fb[ri] / 2, fb[ri])
+        side[li], side[ri] = 1, -1
+
+        active = active[~done]
+    return BatchResult(x, converged, iterations)
@@ -0,0 +1,41 @@
+from collections.abc import Callable
+
+from comp_math.expressions import as_function
+from comp_math.instrumentation import Monitor, instrumented
+
+
+@instrumented
+def bisection_method(func: Callable | str, a: float, b: float, epsilon: float,
+                     monitor: Monitor | None = None) -> float:
+    """
+    Реализует метод половинного деления для численного решения уравнения
+     f(x) = 0 на заданном отрезке [a, b].
+
+    Параметры:
+        func: Функция f(x) или запись выражения.
+        a: Начало отрезка.
+        b: Конец отрезка.
+        epsilon: Точность решения.
+        monitor: Монитор для сбора метрик (итерации, вычисления функции, невязки, время).
+
+    Возвращаемое значение:
+        Приближенное значение корня уравнения f(x) = 0. Если функция обращается в нуль
+        на конце отрезка, возвращается этот конец.
+    """
+    func = as_function(func)
+    if monitor is not None:
+        func = monitor.function(func)
+    fa, fb = func(a), func(b)  # значение на левом конце хранится между итерациями
+    if fa == 0 or fb == 0:  # корень на конце отрезка (в том числе вырожденного)
+        return a if fa == 0 else b
+    if fa * fb > 0:
+        raise ValueError("Условие существования корня не выполнено на заданном отрезке")
+
+    while abs(fx := func(x := ((a + b) / 2))) >= epsilon:
+        if fx * fa < 0:
+            b = x
+        else:
+            a, fa = x, fx
+        if monitor is not None:
+            monitor.step(x, abs(fx))
+    return x
@@ -0,0 +1,127 @@
+from collections.abc import Callable, Iterator
+from itertools import count
+
+import numpy as np
+
+from comp_math.expressions import as_function
+
+
+def evaluate_on_grid(func: callable, x: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет значения функции сразу во всех точках массива.
+
+    Если функция не умеет работать с массивами numpy (например, использует модуль math),
+    то она вычисляется поэлементно.
+
+    Параметры:
+        func: Функция f(x).
+        x: Массив точек.
+
+    Возвращаемое значение:
+        Массив значений функции той же формы, что и x.
+    """
+    try:
+        y = np.asarray(func(x), dtype=float)
+    except (TypeError, ValueError):
+        y = np.fromiter((func(xi) for xi in x.flat), dtype=float, count=x.size).reshape(x.shape)
+    return np.broadcast_to(y, x.shape)
+
+
+def iter_brackets(func: Callable | str, start: float, step: float, stop: float | None = None,
+                  chunk_size: int = 4096) -> Iterator[tuple[float, float]]:
+    """
+    Лениво перебирает отрезки [x_i, x_i+1], на концах которых функция меняет знак.
+    Корень, попавший точно в узел сетки (f(x_i) = 0), возвращается вырожденным
+    отрезком (x_i, x_i) ровно один раз.
+
+    Сетка x_i = start + i * step (с последним узлом stop) обрабатывается порциями по chunk_size точек: функция
+    вычисляется на всей порции одним вызовом, а последнее значение порции переиспользуется
+    в следующей, так что каждая точка сетки вычисляется ровно один раз.
+
+    Параметры:
+        func: Функция f(x) или запись выражения, корни которой необходимо отделить.
+        start: Начало отрезка поиска.
+        step: Шаг сетки (должен быть положительным).
+        stop: Конец отрезка поиска. Если не задан, перебор не ограничен сверху.
+        chunk_size: Количество шагов сетки в одной порции.
+
+    Возвращаемое значение:
+        Генератор кортежей (начало, конец) отрезков, содержащих корень функции, в порядке возрастания.
+    """
+    if step <= 0:
+        raise ValueError("Шаг должен быть положительным")
+    func = as_function(func)
+    if chunk_size < 1:
+        raise ValueError("Размер порции должен быть положительным")
+
+    # количество шагов сетки на ограниченном отрезке (с допуском на ошибку округления);
+    # если stop не попадает в узел, последний отрезок [x_k, stop] короче шага
+    total = None if stop is None else int(np.ceil((stop - start) / step - 1e-9))
+    offsets = np.arange(chunk_size + 1)
+    y_last = None
+    for first in count(0, chunk_size):
+        if total is not None and first >= total:
+            return
+        n = chunk_size if total is None else min(chunk_size, total - first)
+        x = start + (first + offsets[:n + 1]) * step  # узлы вычисляются от start, без накопления ошибки
+        if total is not None and first + n == total:
+            x[-1] = stop
+        if y_last is None:
+            y = evaluate_on_grid(func, x)
+        else:
+            y = np.empty(n + 1)
+            y[0] = y_last
+            y[1:] = evaluate_on_grid(func, x[1:])
+        y_last = y[-1]
+
+        # нули в узлах (первый узел порции, кроме самой первой, проверен в предыдущей порции)
+        # и смена знака на концах отрезков с ненулевыми значениями; позиция 2i — узел x_i,
+        # позиция 2i + 1 — отрезок [x_i, x_i+1]
+        signs = np.sign(y)
+        skip = 1 if first else 0
+        zeros = np.flatnonzero(signs[skip:] == 0) + skip
+        changes = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+        for position in np.sort(np.concatenate([2 * zeros, 2 * changes + 1])):
+            i = position // 2
+            yield float(x[i]), float(x[i + position % 2])
+
+
+def find_brackets(func: Callable | str, start: float, stop: float, step: float,
+                  chunk_size: int = 4096) -> list[tuple[float, float]]:
+    """
+    Находит все отрезки длины step на [start, stop], содержащие корень функции.
+
+    Параметры:
+        func: Функция f(x) или запись выражения, корни которой необходимо отделить.
+        start: Начало отрезка поиска.
+        stop: Конец отрезка поиска.
+        step: Шаг сетки.
+        chunk_size: Количество шагов сетки в одной порции.
+
+    Возвращаемое значение:
+        Список кортежей (начало, конец) отрезков, содержащих корень функции.
+    """
+    return list(iter_brackets(func, start, step, stop=stop, chunk_size=chunk_size))
+
+
+def step_method(func: Callable | str, start: float, step: float, stop: float | None = None,
+                max_steps: int = 10 ** 6) -> tuple[float, float]:
+    """
+    Находит отрезок, содержащий корень функции.
+
+    Параметры:
+        func: Функция f(x) или запись выражения, корень которой необходимо найти.
+        start: Начало отрезка поиска.
+        step: Шаг при переборе точек на отрезке.
+        stop: Конец отрезка поиска. По умолчанию start + max_steps * step.
+        max_steps: Максимальное количество шагов, если stop не задан.
+
+    Возвращаемое значение:
+        Кортеж с началом и концом сегмента, содержащего корень функции.
+    """
+    if stop is None:
+        stop = start + max_steps * step
+    # небольшие порции: корень обычно находится недалеко от start
+    for bracket in iter_brackets(func, start, step, stop=stop, chunk_size=256):
+        return bracket
+    raise ValueError(f"На отрезке [{start}, {stop}] смена знака функции не найдена")
@@ -0,0 +1,328 @@
+from collections.abc import Callable
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from comp_math.expressions import CompiledExpression, as_function, compile_expression
+from comp_math.instrumentation import Monitor, instrumented
+
+
+class RootResult(NamedTuple):
+    """
+    Результат итерационного поиска корня.
+
+    Поля:
+        root: Приближенное значение корня.
+        iterations: Количество выполненных итераций.
+        residuals: История невязок |f(x)| на каждой итерации (включая начальное приближение).
+        elapsed: Время работы метода в секундах.
+    """
+    root: float
+    iterations: int
+    residuals: list[float]
+    elapsed: float = 0.0
+
+
+class Dual:
+    """
+    Дуальное число второго порядка a + b * e + c * e ** 2 / 2 (e ** 3 = 0).
+
+    Вычисление функции от Dual(x, 1, 0) дает значение функции и ее первые две
+    производные в точке x (прямой режим автоматического дифференцирования).
+    Поддерживаются арифметические операции, возведение в числовую степень и элементарные
+    функции numpy (numpy.exp, numpy.log, numpy.sin и т. д. вызывают одноименные методы).
+    Компоненты могут быть массивами numpy.
+    """
+    __slots__ = ("value", "d1", "d2")
+
+    def __init__(self, value: float, d1: float = 0.0, d2: float = 0.0):
+        self.value, self.d1, self.d2 = value, d1, d2
+
+    @staticmethod
+    def _lift(other) -> "Dual":
+        return other if isinstance(other, Dual) else Dual(other)
+
+    def __add__(self, other):
+        other = self._lift(other)
+        return Dual(self.value + other.value, self.d1 + other.d1, self.d2 + other.d2)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Dual(-self.value, -self.d1, -self.d2)
+
+    def __sub__(self, other):
+        return self + (-self._lift(other))
+
+    def __rsub__(self, other):
+        return self._lift(other) - self
+
+    def __mul__(self, other):
+        other = self._lift(other)
+        return Dual(self.value * other.value,
+                    self.d1 * other.value + self.value * other.d1,
+                    self.d2 * other.value + 2 * self.d1 * other.d1 + self.value * other.d2)
+
+    __rmul__ = __mul__
+
+    def reciprocal(self) -> "Dual":
+        inv = 1 / self.value
+        return Dual(inv, -self.d1 * inv ** 2, (2 * self.d1 ** 2 * inv - self.d2) * inv ** 2)
+
+    def __truediv__(self, other):
+        return self * self._lift(other).reciprocal()
+
+    def __rtruediv__(self, other):
+        return self._lift(other) * self.reciprocal()
+
+    def __pow__(self, power: float):
+        if isinstance(power, Dual):
+            raise TypeError("Показатель степени должен быть числом")
+        d1 = power * self.value ** (power - 1)
+        d2 = d1 * self.d2
+        if power != 1:
+            d2 += power * (power - 1) * self.value ** (power - 2) * self.d1 ** 2
+        return Dual(self.value ** power, d1 * self.d1, d2)
+
+    def __abs__(self):
+        return self._chain(np.abs(self.value), np.sign(self.value), 0.0)
+
+    def _chain(self, value, d1, d2) -> "Dual":
+        # g(u) по значению g(a) и производным g'(a), g''(a) внешней функции
+        return Dual(value, d1 * self.d1, d2 * self.d1 ** 2 + d1 * self.d2)
+
+    def exp(self) -> "Dual":
+        value = np.exp(self.value)
+        return self._chain(value, value, value)
+
+    def log(self) -> "Dual":
+        return self._chain(np.log(self.value), 1 / self.value, -1 / self.value ** 2)
+
+    def log10(self) -> "Dual":
+        return self.log() / np.log(10)
+
+    def log2(self) -> "Dual":
+        return self.log() / np.log(2)
+
+    def sqrt(self) -> "Dual":
+        return self ** 0.5
+
+    def sin(self) -> "Dual":
+        return self._chain(np.sin(self.value), np.cos(self.value), -np.sin(self.value))
+
+    def cos(self) -> "Dual":
+        return self._chain(np.cos(self.value), -np.sin(self.value), -np.cos(self.value))
+
+    def tan(self) -> "Dual":
+        return self.sin() / self.cos()
+
+    def arctan(self) -> "Dual":
+        return self._chain(np.arctan(self.value), 1 / (1 + self.value ** 2),
+                           -2 * self.value / (1 + self.value ** 2) ** 2)
+
+
+@lru_cache(maxsize=128)
+def symbolic_derivatives(func: callable) -> tuple[callable, callable, callable]:
+    """
+    Строит функцию и ее первые две производные символьным дифференцированием (sympy).
+
+    Функция вызывается один раз от символа x, поэтому она должна состоять из операций,
+    поддерживаемых sympy. Результат компилируется lambdify и кешируется.
+
+    Параметры:
+        func: Функция f(x).
+
+    Возвращаемое значение:
+        Кортеж скомпилированных функций (f, f', f'').
+    """
+    import sympy as sp  # sympy загружается только при первом символьном дифференцировании
+
+    x = sp.Symbol("x", real=True)
+    expr = sp.sympify(func(x))
+    # дельта-функции в точках разрыва производной (например, у Abs) отбрасываются
+    return tuple(sp.lambdify(x, sp.diff(expr, x, k).replace(sp.DiracDelta, lambda *args: sp.S.Zero), "math")
+                 for k in range(3))
+
+
+# функции, которые не удалось продифференцировать символьно (lru_cache не кеширует исключения)
+_dual_fallbacks = {}
+
+
+def dual_derivatives(func: callable) -> tuple[callable, callable, callable]:
+    """
+    Строит функцию и ее первые две производные с помощью дуальных чисел.
+
+    Параметры:
+        func: Функция f(x), составленная из арифметических операций и функций numpy
+            (см. Dual).
+
+    Возвращаемое значение:
+        Кортеж функций (f, f', f'').
+    """
+    def component(name: str) -> callable:
+        def evaluate(x):
+            try:
+                return getattr(Dual._lift(func(Dual(x, 1.0, 0.0))), name)
+            except (TypeError, AttributeError) as error:
+                raise ValueError("Не удалось продифференцировать функцию ни символьно, ни с помощью "
+                                 "дуальных чисел: используйте арифметические операции и функции numpy "
+                                 "(exp, log, sin, cos, ...) или задайте производную явно") from error
+        return evaluate
+    return component("value"), component("d1"), component("d2")
+
+
+def derivative_functions(func: Callable | str, mode: str = "symbolic") -> tuple[callable, callable, callable]:
+    """
+    Возвращает функцию и ее первые две производные.
+
+    Параметры:
+        func: Функция f(x) или запись выражения (записи всегда дифференцируются символьно).
+        mode: Способ построения производных для функции: "symbolic" (sympy) или "dual" (дуальные числа).
+            Если функцию нельзя вычислить от символа sympy (например, она использует numpy.exp),
+            производные строятся с помощью дуальных чисел.
+
+    Возвращаемое значение:
+        Кортеж функций (f, f', f'').
+    """
+    if isinstance(func, str):
+        # запись выражения дифференцируется символьно через общий реестр выражений
+        func = compile_expression(func)
+    if isinstance(func, CompiledExpression):
+        return func, func.derivative(1), func.derivative(2)
+    if mode == "symbolic":
+        if func in _dual_fallbacks:
+            return _dual_fallbacks[func]
+        try:
+            return symbolic_derivatives(func)
+        except (TypeError, AttributeError, ValueError, NotImplementedError):
+            # функция не поддерживает символьные вычисления (SympifyError — подкласс ValueError,
+            # ошибки печати lambdify — подклассы NotImplementedError)
+            if len(_dual_fallbacks) >= symbolic_derivatives.cache_info().maxsize:
+                _dual_fallbacks.pop(next(iter(_dual_fallbacks)))
+            derivatives = _dual_fallbacks[func] = dual_derivatives(func)
+            return derivatives
+    if mode == "dual":
+        return dual_derivatives(func)
+    raise ValueError(f"Неизвестный способ дифференцирования: {mode}")
+
+
+@instrumented
+def newton_method(func: Callable | str, x0: float, epsilon: float, derivative: callable = None,
+                  mode: str = "symbolic", max_iterations: int = 50, monitor: Monitor | None = None) -> RootResult:
+    """
+    Реализует метод Ньютона (метод касательных) для численного решения уравнения f(x) = 0:
+       x_k+1 = x_k - f(x_k) / f'(x_k)
+
+    Параметры:
+        func: Функция f(x) или запись выражения.
+        x0: Начальное приближение.
+        epsilon: Точность решения (по значению |f(x)|).
+        derivative: Производная f'(x). Если не задана, строится согласно mode.
+        mode: Способ построения производной для функции: "symbolic" (sympy) или "dual" (дуальные числа).
+        max_iterations: Максимальное количество итераций.
+        monitor: Монитор для сбора метрик (итерации, вычисления функции, невязки, время).
+
+    Возвращаемое значение:
+        RootResult с корнем, количеством итераций и историей невязок.
+    """
+    func = as_function(func)
+    if derivative is None:
+        func, derivative, _ = derivative_functions(func, mode)
+    if monitor is not None:
+        func = monitor.function(func)
+
+    x = x0
+    residuals = [abs(fx := func(x))]
+    for iteration in range(1, max_iterations + 1):
+        if residuals[-1] < epsilon:
+            return RootResult(x, iteration - 1, residuals)
+        dfx = derivative(x)
+        if dfx == 0:
+            raise ValueError("Производная обратилась в ноль, метод Ньютона неприменим")
+        x -= fx / dfx
+        residuals.append(abs(fx := func(x)))
+        if monitor is not None:
+            monitor.step(x, residuals[-1])
+    if residuals[-1] < epsilon:
+        return RootResult(x, max_iterations, residuals)
+    raise ValueError(f"Метод Ньютона не сошелся за {max_iterations} итераций")
+
+
+@instrumented
+def secant_method(func: Callable | str, x0: float, x1: float, epsilon: float,
+                  max_iterations: int = 50, monitor: Monitor | None = None) -> RootResult:
+    """
+    Реализует метод секущих: производная в методе Ньютона заменяется разностным
+    отношением по двум последним приближениям. Один вызов функции на итерацию.
+
+    Параметры:
+        func: Функция f(x) или запись выражения.
+        x0: Первое начальное приближение.
+        x1: Второе начальное приближение.
+        epsilon: Точность решения (по значению |f(x)|).
+        max_iterations: Максимальное количество итераций.
+        monitor: Монитор для сбора метрик (итерации, вычисления функции, невязки, время).
+
+    Возвращаемое значение:
+        RootResult с корнем, количеством итераций и историей невязок.
+    """
+    func = as_function(func)
+    if monitor is not None:
+        func = monitor.function(func)
+    f0, f1 = func(x0), func(x1)
+    residuals = [abs(f0), abs(f1)]
+    for iteration in range(1, max_iterations + 1):
+        if abs(f1) < epsilon:
+            return RootResult(x1, iteration - 1, residuals)
+        if f1 == f0:
+            raise ValueError("Значения функции в двух приближениях совпали, метод секущих неприменим")
+        x0, x1 = x1, x1 - f1 * (x1 - x0) / (f1 - f0)
+        f0, f1 = f1, func(x1)
+        residuals.append(abs(f1))
+        if monitor is not None:
+            monitor.step(x1, residuals[-1])
+    if abs(f1) < epsilon:
+        return RootResult(x1, max_iterations, residuals)
+    raise ValueError(f"Метод секущих не сошелся за {max_iterations} итераций")
+
+
+@instrumented
+def halley_method(func: Callable | str, x0: float, epsilon: float, mode: str = "symbolic",
+                  max_iterations: int = 50, monitor: Monitor | None = None) -> RootResult:
+    """
+    Реализует метод Галлея (кубическая сходимость):
+       x_k+1 = x_k - 2 f f' / (2 f' ** 2 - f f'')
+
+    Параметры:
+        func: Функция f(x) или запись выражения.
+        x0: Начальное приближение.
+        epsilon: Точность решения (по значению |f(x)|).
+        mode: Способ построения производных для функции: "symbolic" (sympy) или "dual" (дуальные числа).
+        max_iterations: Максимальное количество итераций.
+        monitor: Монитор для сбора метрик (итерации, вычисления функции, невязки, время).
+
+    Возвращаемое значение:
+        RootResult с корнем, количеством итераций и историей невязок.
+    """
+    func = as_function(func)
+    func, first, second = derivative_functions(func, mode)
+    if monitor is not None:
+        func = monitor.function(func)
+
+    x = x0
+    residuals = [abs(fx := func(x))]
+    for iteration in range(1, max_iterations + 1):
+        if residuals[-1] < epsilon:
+            return RootResult(x, iteration - 1, residuals)
+        d1, d2 = first(x), second(x)
+        denominator = 2 * d1 ** 2 - fx * d2
+        if denominator == 0:
+            raise ValueError("Знаменатель обратился в ноль, метод Галлея неприменим")
+        x -= 2 * fx * d1 / denominator
+        residuals.append(abs(fx := func(x)))
+        if monitor is not None:
+            monitor.step(x, residuals[-1])
+    if residuals[-1] < epsilon:
+        return RootResult(x, max_iterations, residuals)
+    raise ValueError(f"Метод Галлея не сошелся за {max_iterations} итераций")
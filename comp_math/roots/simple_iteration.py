@@ -0,0 +1,174 @@
+from collections.abc import Callable
+
+import numpy as np
+
+from comp_math.expressions import as_function
+from comp_math.instrumentation import Monitor, instrumented
+from comp_math.roots.batch import BatchResult
+from comp_math.roots.brackets import evaluate_on_grid
+from comp_math.roots.newton import RootResult, derivative_functions
+
+
+def relaxation(func: Callable | str, a: float, b: float, samples: int = 101) -> tuple[callable, float]:
+    """
+    Строит эквивалентную функцию g(x) = x - λ * f(x) для метода простых итераций.
+
+    Параметр λ = 2 / (m + M) выбирается по оценкам m <= f'(x) <= M на отрезке [a, b]
+    (производная вычисляется на сетке из samples точек). Тогда
+    |g'(x)| <= q = (M - m) / (M + m) < 1, если производная не меняет знак.
+
+    Параметры:
+        func: Функция f(x) или запись выражения.
+        a: Начало отрезка.
+        b: Конец отрезка.
+        samples: Количество точек сетки для оценки производной.
+
+    Возвращаемое значение:
+        Кортеж из функции g(x) и оценки коэффициента сжатия q.
+    """
+    func = as_function(func)
+    _, derivative, _ = derivative_functions(func)
+    d = evaluate_on_grid(derivative, np.linspace(a, b, samples))
+    m, M = d.min(), d.max()
+    if m * M <= 0:
+        raise ValueError("Производная меняет знак на отрезке, условие сходимости не выполнено")
+
+    lam = 2 / (m + M)
+    q = abs((M - m) / (M + m))
+    return (lambda x: x - lam * func(x)), q
+
+
+@instrumented
+def fixed_point_iteration(g: callable, x0: float, epsilon: float, accelerate: str | None = None,
+                          max_iterations: int = 100, patience: int = 10,
+                          monitor: Monitor | None = None) -> RootResult:
+    """
+    Реализует метод простых итераций x_k+1 = g(x_k) с необязательным ускорением.
+
+    Ускорение "aitken" применяет Δ²-процесс Эйткена к каждой тройке x, g(x), g(g(x))
+    и продолжает итерации с g(g(x)); "steffensen" продолжает итерации с ускоренного
+    значения (квадратичная сходимость). Итерации прерываются, если за patience итераций
+    шаг не уменьшился (расходимость или застой).
+
+    Параметры:
+        g: Функция g(x), неподвижная точка которой ищется.
+        x0: Начальное приближение.
+        epsilon: Точность решения (по величине шага |g(x) - x|).
+        accelerate: Способ ускорения: None, "aitken" или "steffensen".
+        max_iterations: Максимальное количество итераций.
+        patience: Допустимое количество итераций без уменьшения шага.
+        monitor: Монитор для сбора метрик (итерации, вычисления функции, невязки, время).
+
+    Возвращаемое значение:
+        RootResult с неподвижной точкой, количеством итераций и историей шагов |g(x) - x|.
+    """
+    if accelerate not in (None, "aitken", "steffensen"):
+        raise ValueError(f"Неизвестный способ ускорения: {accelerate}")
+    if monitor is not None:
+        g = monitor.function(g)
+
+    x = x0
+    residuals = []
+    best, stalled = np.inf, 0
+    for iteration in range(1, max_iterations + 1):
+        x1 = g(x)
+        residuals.append(step := abs(x1 - x))
+        if monitor is not None:
+            monitor.step(x1, step)
+        if step < epsilon:
+            return RootResult(x1, iteration, residuals)
+
+        if step < best:
+            best, stalled = step, 0
+        elif (stalled := stalled + 1) >= patience or not np.isfinite(step):
+            raise ValueError(f"Метод простых итераций не сходится (итерация {iteration})")
+
+        if accelerate is None:
+            x = x1
+            continue
+        x2 = g(x1)
+        denominator = x2 - 2 * x1 + x
+        accelerated = x2 if denominator == 0 else x - (x1 - x) ** 2 / denominator
+        if accelerate == "steffensen":
+            x = accelerated
+        else:
+            # Δ²-процесс Эйткена ускоряет последовательность, но не меняет ее
+            if abs(accelerated - x2) < epsilon:
+                residuals.append(abs(accelerated - x2))
+                return RootResult(accelerated, iteration, residuals)
+            x = x2
+    raise ValueError(f"Метод простых итераций не сошелся за {max_iterations} итераций")
+
+
+def batch_fixed_point(g: callable, x0: np.ndarray, epsilon: float, accelerate: bool = True,
+                      max_iterations: int = 100) -> BatchResult:
+    """
+    Реализует метод простых итераций (или метод Стеффенсена) одновременно для N начальных приближений.
+
+    Параметры:
+        g: Функция g(x), принимающая массив numpy.
+        x0: Массив начальных приближений.
+        epsilon: Точность решения (по величине шага |g(x) - x|).
+        accelerate: Использовать ускорение Стеффенсена.
+        max_iterations: Максимальное количество итераций.
+
+    Возвращаемое значение:
+        BatchResult с неподвижными точками, признаками сходимости и количеством итераций.
+        Расходящиеся задачи (нечисловые значения) помечаются как несошедшиеся.
+    """
+    x = np.array(x0, dtype=float, ndmin=1)
+    n = x.size
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=int)
+    active = np.arange(n)
+    for _ in range(max_iterations):
+        xa = x[active]
+        x1 = evaluate_on_grid(g, xa)
+        iterations[active] += 1
+        if accelerate:
+            x2 = evaluate_on_grid(g, x1)
+            denominator = x2 - 2 * x1 + xa
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_new = np.where(denominator == 0, x2, xa - (x1 - xa) ** 2 / denominator)
+        else:
+            x_new = x1
+        x[active] = x_new
+
+        done = np.abs(x1 - xa) < epsilon
+        converged[active[done]] = True
+        active = active[~done & np.isfinite(x_new)]
+        if active.size == 0:
+            break
+    return BatchResult(x, converged, iterations)
+
+
+def simple_iteration_method(func: Callable | str, a: float, b: float, epsilon: float,
+                            g: callable = None, accelerate: str | None = None,
+                            monitor: Monitor | None = None) -> float:
+    """
+    Реализует метод простых итераций для численного решения уравнения
+       f(x) = 0 на заданном отрезке [a, b].
+    Если эквивалентная функция g(x) не задана, она строится автоматически:
+      g(x) = x - λ * f(x), где λ выбирается по оценкам производной f'(x) на [a, b]
+      так, что |g'(x)| < 1.
+
+    Параметры:
+        func: Функция f(x) или запись выражения.
+        a: Начало отрезка.
+        b: Конец отрезка.
+        epsilon: Точность решения (по величине шага |g(x) - x|).
+        g: Эквивалентная функция g(x). Условие сходимости |g'(x)| < 1 проверяется на концах отрезка.
+        accelerate: Способ ускорения: None, "aitken" или "steffensen".
+        monitor: Монитор для сбора метрик (итерации, вычисления функции, невязки, время).
+
+    Возвращаемое значение:
+        Приближенное значение корня уравнения f(x) = 0.
+    """
+    if g is None:
+        g, _ = relaxation(func, a, b)
+    else:
+        _, dg, _ = derivative_functions(g, mode="dual")
+        if any(abs(dg(point)) >= 1 for point in [a, b]):
+            raise ValueError("Условие сходимости не выполнено на заданном отрезке")
+
+    return fixed_point_iteration(g, a, epsilon, accelerate=accelerate, monitor=monitor).root
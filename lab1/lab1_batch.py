@@ -0,0 +1,24 @@
+import numpy as np
+
+from comp_math.roots import batch_bisection, batch_illinois, batch_newton
+
+
+def main() -> None:
+    # Семейство многочленов x ** 3 + 0.2 * x ** 2 + 0.5 * x + c для разных свободных членов
+    free_terms = np.linspace(-2.0, -0.5, 7)
+    coefficients = np.column_stack([np.ones_like(free_terms), np.full_like(free_terms, 0.2),
+                                    np.full_like(free_terms, 0.5), free_terms])
+    a, b = np.zeros_like(free_terms), np.full_like(free_terms, 2.0)
+
+    for name, result in [
+        ("Метод половинного деления", batch_bisection(coefficients, a, b, epsilon=1e-10)),
+        ("Метод Ньютона", batch_newton(coefficients, b, epsilon=1e-10)),
+        ("Метод Иллинойса", batch_illinois(coefficients, a, b, epsilon=1e-10)),
+    ]:
+        print(f"{name}:")
+        for c, root, it in zip(free_terms, result.roots, result.iterations):
+            print(f"  c = {c:.2f}: x = {root:.6f}, итераций: {it}")
+
+
+if __name__ == "__main__":
+    main()
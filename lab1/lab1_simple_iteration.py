@@ -1,62 +1,5 @@
-from scipy.misc import derivative
-import warnings
-
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-
-
-def f(x: float) -> float:
-    """
-    Вычисляет значение функции f(x) = x ** 3 + 0.2 * x ** 2 + 0.5 * x - 1.2
-
-    Параметры:
-        x: Значение аргумента функции.
-
-    Возвращаемое значение:
-        Значение функции в точке x.
-    """
-    return x ** 3 + 0.2 * x ** 2 + 0.5 * x - 1.2
-
-
-def step_method(func: callable, start: float, step: float) -> tuple[int, int]:
-    """
-    Находит отрезок, содержащий корень функции.
-
-    Параметры:
-        func: Функция f(x), корень которой необходимо найти.
-        start: Начало отрезка поиска.
-        step: Шаг при переборе точек на отрезке.
-
-    Возвращаемое значение:
-        Кортеж с началом и концом сегмента, содержащего корень функции.
-    """
-    x0, x1 = start, start + step
-    while func(x0) * func(x1) >= 0:
-        x0, x1 = x1, x1 + step
-    return round(x0, 2), round(x1, 2)
-
-
-def simple_iteration_method(func: callable, a: float, b: float, epsilon: float) -> float:
-    """
-    Реализует метод простых итераций для численного решения уравнения
-       f(x) = 0 на заданном отрезке [a, b].
-    Реализовано для функции f(x) = x ** 3 + 0.2 * x ** 2 + 0.5 * x - 1.2 = 0
-    Тогда g(x) = (1.2 - 0.2 * x ** 2 - 0.5 * x) ** (1 / 3) является эквивалентной,
-      так как g'(x) меньше 1 для обоих концов отрезка
-
-    Параметры:
-        a: Начало отрезка.
-        epsilon: Точность решения.
-
-    Возвращаемое значение:
-        Приближенное значение корня уравнения f(x) = 0.
-    """
-    g = lambda x: (1.2 - 0.2 * x ** 2 - 0.5 * x) ** (1 / 3)
-    if any(derivative(g, x0=point) >= 1 for point in [a, b]):
-        raise ValueError("Условие сходимости не выполнено на заданном отрезке")
-    xi = g(a)
-    while abs(func(xi)) >= epsilon:
-        xi = g(xi)
-    return xi
+from comp_math.roots import fixed_point_iteration, relaxation, simple_iteration_method, step_method
+from lab1_step_method import f
 
 
 def main():
@@ -65,6 +8,12 @@ def main():
     root_simple_iteration = simple_iteration_method(f, a, b, epsilon=0.001)
     print(f"Метод простой итерации: {root_simple_iteration:.4f}")
 
+    g, q = relaxation(f, a, b)
+    print(f"Коэффициент сжатия g(x) = x - λf(x) на [{a:.2f}, {b:.2f}]: {q:.4f}")
+    for accelerate in (None, "aitken", "steffensen"):
+        result = fixed_point_iteration(g, a, epsilon=1e-12, accelerate=accelerate)
+        print(f"Ускорение {accelerate}: {result.root:.10f}, итераций: {result.iterations}")
+
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,12 @@
+from comp_math.roots import find_brackets, step_method
+
+
 def f(x: float) -> float:
     """
     Вычисляет значение функции f(x) = x ** 3 + 0.2 * x ** 2 + 0.5 * x - 1.2
 
     Параметры:
-        x: Значение аргумента функции.
+        x: Значение аргумента функции (число или массив numpy).
 
     Возвращаемое значение:
         Значение функции в точке x.
@@ -11,28 +14,15 @@ def f(x: float) -> float:
     return x ** 3 + 0.2 * x ** 2 + 0.5 * x - 1.2
 
 
-def step_method(func: callable, start: float, step: float) -> tuple[int, int]:
-    """
-    Находит отрезок, содержащий корень функции.
-
-    Параметры:
-        func: Функция f(x), корень которой необходимо найти.
-        start: Начало отрезка поиска.
-        step: Шаг при переборе точек на отрезке.
-
-    Возвращаемое значение:
-        Кортеж с началом и концом сегмента, содержащего корень функции.
-    """
-    x0, x1 = start, start + step
-    while func(x0) * func(x1) >= 0:
-        x0, x1 = x1, x1 + step
-    return x0, x1
-
-
 def main() -> None:
     # Использование методов
     a, b = step_method(func=f, start=0.8, step=0.01)
     print(f"Корень уравнения находится на отрезке: [{a:.3f}, {b:.3f}]")
+    brackets = find_brackets(func=f, start=-10, stop=10, step=0.01)
+    print(f"Все отрезки с корнями на [-10, 10]: {[(round(x0, 3), round(x1, 3)) for x0, x1 in brackets]}")
+    # stop не попадает в узел сетки: последний отрезок [0.8, 0.87] короче шага
+    brackets = find_brackets(func=f, start=0.5, stop=0.87, step=0.1)
+    print(f"Отрезки с корнями на [0.5, 0.87] с шагом 0.1: {[(round(x0, 3), round(x1, 3)) for x0, x1 in brackets]}")
 
 
 if __name__ == "__main__":
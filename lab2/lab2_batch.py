@@ -0,0 +1,28 @@
+import numpy as np
+
+from comp_math.linalg import batch_gauss
+
+
+def main() -> None:
+    # Использование методов
+    A = np.array([[3.11, -1.66, -0.6],
+                  [-1.65, 3.51, -0.78],
+                  [0.6, 0.78, -1.87]])
+
+    B = np.array([-0.92, 2.57, 1.65])
+
+    # пакет из миллиона возмущенных копий системы и одна вырожденная система
+    rng = np.random.default_rng(0)
+    batch = 1_000_000
+    a = A + 0.01 * rng.standard_normal((batch, 3, 3))
+    b = B + 0.01 * rng.standard_normal((batch, 3))
+    a[-1] = [[1, 2, 3], [2, 4, 6], [1, 1, 1]]
+
+    solution = batch_gauss(a, b, processes=None)
+    print(f"Решение первой системы пакета:")
+    print("; ".join(f'x{i} = {x:.4f}' for i, x in enumerate(solution.x[0], 1)))
+    print(f"Решено систем: {batch}, вырожденных: {solution.singular.sum()}")
+
+
+if __name__ == '__main__':
+    main()
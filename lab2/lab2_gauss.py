@@ -1,38 +1,6 @@
 import numpy as np
 
-
-def gauss(a: np.array, b: np.array) -> np.ndarray:
-    """
-    Рассчитывает решение системы линейных уравнений с использованием метода Гаусса.
-
-    Параметры:
-        a (numpy.ndarray): Матрица коэффициентов системы линейных уравнений.
-        b (numpy.ndarray): Вектор правых частей системы линейных уравнений.
-
-    Возвращает:
-        x (numpy.ndarray): Вектор решения системы линейных уравнений.
-    """
-    n = len(a)
-    system = np.hstack([a, b.reshape(-1, 1)])
-    print(f"Объединенная матрица системы линейных уравнений:\n{system}")
-
-    for i in range(n):
-        # нахождение индекса строки с максимальным абсолютным значением
-        max_row_index = np.abs(system[i:, i]).argmax() + i
-
-        # перестановка строк
-        if i != max_row_index:
-            system[[i, max_row_index]] = system[[max_row_index, i]]
-
-        # зануление i-тых элементов строк
-        for j in range(i + 1, n):
-            system[j] = system[j] - system[i] * system[j, i] / system[i, i]
-    print(f"Система приведена к треугольному виду:\n{system.round(4)}")
-    x = np.zeros(n)
-    for i in range(n - 1, -1, -1):
-        x[i] = (system[i, -1] - np.dot(system[i, :-1], x)) / system[i, i]
-
-    return x
+from comp_math.linalg import gauss, iterative_refinement, lu_factor, lu_solve
 
 
 def main() -> None:
@@ -43,10 +11,24 @@ def main() -> None:
 
     B = np.array([-0.92, 2.57, 1.65])
 
-    solution = gauss(A, B)
+    solution = gauss(A, B, verbose=True)
     print(f"Решение методом Гаусса:")
     print("; ".join(f'x{i} = {x:.4f}' for i, x in enumerate(solution, 1)))
 
+    # одно разложение для нескольких правых частей
+    factors = lu_factor(A)
+    solutions = lu_solve(factors, np.column_stack([B, 2 * B, A @ np.ones(3)]))
+    print(f"Решения для нескольких правых частей по одному LU-разложению:\n{solutions.round(4)}")
+
+    # разложение в одинарной точности с уточнением решения до двойной
+    n = 1000
+    rng = np.random.default_rng(0)
+    A_large = rng.standard_normal((n, n))
+    B_large = rng.standard_normal(n)
+    result = iterative_refinement(A_large, B_large, lu_factor(A_large, dtype=np.float32))
+    print(f"Смешанная точность, система из {n} уравнений: итераций уточнения {result.iterations}, "
+          f"невязка {result.residuals[-1]:.2e}")
+
 
 if __name__ == '__main__':
     main()
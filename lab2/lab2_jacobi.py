@@ -1,37 +1,7 @@
 import numpy as np
+import scipy.sparse as sps
 
-
-def jacobi(a: np.ndarray, b: np.ndarray, epsilon: float, max_iterations: int = 1000) -> np.ndarray:
-    """
-    Рассчитывает решение системы линейных уравнений с использованием метода Якоби.
-
-    Параметры:
-        a (numpy.ndarray): Матрица коэффициентов системы линейных уравнений.
-        b (numpy.ndarray): Вектор правых частей системы линейных уравнений.
-        epsilon (float, опционально): Точность сходимости. По умолчанию 0.0001.
-        max_iterations (int, опционально): Максимальное количество итераций. По умолчанию 1000.
-
-    Возвращает:
-        x (numpy.ndarray): Вектор решения системы линейных уравнений.
-    """
-    n = len(a)
-    x = np.zeros(n)  # начальное приближение (нулевой вектор)
-    it_counter = 0  # счетчик итераций
-    for _ in range(max_iterations):
-        x_new = np.copy(x)
-        it_counter += 1
-
-        for i in range(n):
-            s1 = np.dot(a[i, :i], x[:i])  # произведение векторов (срезов, чтобы исключить диагональные элементы)
-            s2 = np.dot(a[i, i + 1:], x[i + 1:])
-            x_new[i] = (b[i] - s1 - s2) / a[i, i]  # вычисление значения нового вектора
-
-        if np.allclose(x, x_new, rtol=epsilon):  # проверка на соответствие заданной точности
-            break
-
-        x = x_new
-    print(f"Количеcтво итераций: {it_counter}")
-    return x
+from comp_math.linalg import jacobi
 
 
 def main() -> None:
@@ -42,9 +12,17 @@ def main() -> None:
 
     B = np.array([-0.92, 2.57, 1.65])
 
-    solution = jacobi(A, B, epsilon=0.001)
+    result = jacobi(A, B, epsilon=0.001)
+    print(f"Количеcтво итераций: {result.iterations}")
     print(f"Решение методом простых итераций (Якоби):")
-    print("; ".join(f'x{i} = {x:.4f}' for i, x in enumerate(solution, 1)))
+    print("; ".join(f'x{i} = {x:.4f}' for i, x in enumerate(result.x, 1)))
+
+    # разреженная трехдиагональная система с диагональным преобладанием
+    n = 100_000
+    A_sparse = sps.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(n, n), format="csr")
+    result = jacobi(A_sparse, np.ones(n), epsilon=1e-10)
+    print(f"Разреженная система из {n} уравнений: итераций {result.iterations}, "
+          f"невязка {result.residuals[-1]:.2e}")
 
 
 if __name__ == '__main__':
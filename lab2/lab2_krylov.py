@@ -0,0 +1,37 @@
+import numpy as np
+import scipy.sparse as sps
+
+from comp_math.linalg import bicgstab, conjugate_gradient, gmres
+
+
+def main() -> None:
+    # Использование методов
+    A = np.array([[3.11, -1.66, -0.6],
+                  [-1.65, 3.51, -0.78],
+                  [0.6, 0.78, -1.87]])
+
+    B = np.array([-0.92, 2.57, 1.65])
+
+    for name, method in [("GMRES", gmres), ("BiCGSTAB", bicgstab)]:
+        result = method(A, B, epsilon=0.001)
+        print(f"Решение методом {name} (итераций: {result.iterations}):")
+        print("; ".join(f'x{i} = {x:.4f}' for i, x in enumerate(result.x, 1)))
+
+    # разностная задача Пуассона на сетке m x m (симметричная положительно определенная матрица)
+    m = 64
+    t = sps.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(m, m))
+    poisson = (sps.kron(sps.identity(m), t) + sps.kron(t, sps.identity(m))).tocsr()
+    rhs = np.ones(m * m)
+    for name, method, preconditioner in [("CG", conjugate_gradient, None),
+                                         ("CG + Якоби", conjugate_gradient, "jacobi"),
+                                         ("CG + SSOR", conjugate_gradient, "ssor"),
+                                         ("GMRES(30) + ILU", gmres, "ilu"),
+                                         ("BiCGSTAB + ILU", bicgstab, "ilu"),
+                                         ("CG без матрицы", conjugate_gradient, None)]:
+        a = poisson.dot if name == "CG без матрицы" else poisson
+        result = method(a, rhs, epsilon=1e-8, preconditioner=preconditioner)
+        print(f"{name}: итераций {result.iterations}, невязка {result.residuals[-1]:.2e}")
+
+
+if __name__ == '__main__':
+    main()
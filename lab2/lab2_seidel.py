@@ -1,33 +1,7 @@
 import numpy as np
+import scipy.sparse as sps
 
-
-def gauss_seidel(a, b, epsilon=0.001, max_iterations=1000):
-    """
-    Рассчитывает решение системы линейных уравнений с использованием метода Гаусса-Зейделя.
-
-    Параметры:
-        a (numpy.ndarray): Матрица коэффициентов системы линейных уравнений.
-        b (numpy.ndarray): Вектор правых частей системы линейных уравнений.
-        epsilon (float, опционально): Точность сходимости. По умолчанию 0.0001.
-        max_iterations (int, опционально): Максимальное количество итераций. По умолчанию 1000.
-
-    Возвращает:
-        x (numpy.ndarray): Вектор решения системы линейных уравнений.
-    """
-    n = len(a)
-    x = np.zeros(n)  # начальное приближение (нулевой вектор)
-    it_counter = 0
-    for _ in range(max_iterations):
-        it_counter += 1
-        for i in range(n):
-            s1 = np.dot(a[i, :i], x[:i])  # произведение векторов (срезов, чтобы исключить диагональные элементы)
-            s2 = np.dot(a[i, i + 1:], x[i + 1:])
-            x[i] = (b[i] - s1 - s2) / a[i, i]  # обновление значений вектора в процессе итерации
-
-        if np.allclose(np.dot(a, x), b, rtol=epsilon):  # проверка на соответствие заданной точности
-            break
-    print(f"Количеcтво итераций: {it_counter}")
-    return x
+from comp_math.linalg import gauss_seidel
 
 
 def main() -> None:
@@ -38,9 +12,21 @@ def main() -> None:
 
     B = np.array([-0.92, 2.57, 1.65])
 
-    solution = gauss_seidel(A, B, epsilon=0.001)
+    result = gauss_seidel(A, B, epsilon=0.001)
+    print(f"Количеcтво итераций: {result.iterations}")
     print(f"Решение методом Гаусса-Зейделя:")
-    print("; ".join(f'x{i} = {x:.4f}' for i, x in enumerate(solution, 1)))
+    print("; ".join(f'x{i} = {x:.4f}' for i, x in enumerate(result.x, 1)))
+
+    # разностная задача Пуассона на сетке m x m (пятиточечный шаблон)
+    m = 32
+    t = sps.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(m, m))
+    poisson = (sps.kron(sps.identity(m), t) + sps.kron(t, sps.identity(m))).tocsr()
+    rhs = np.ones(m * m)
+    for name, kwargs in [("Гаусс-Зейдель", {}),
+                         ("SOR, ω = auto", {"omega": "auto"}),
+                         ("SOR красно-черный, ω = auto", {"omega": "auto", "ordering": "red-black"})]:
+        result = gauss_seidel(poisson, rhs, epsilon=1e-6, max_iterations=20000, check_every=10, **kwargs)
+        print(f"{name}: итераций {result.iterations}, невязка {result.residuals[-1]:.2e}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,35 @@
+import numpy as np
+
+from comp_math.interp import CubicSpline
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # Таблицы лабораторной работы 3
+    x = [0.43, 0.48, 0.55, 0.62, 0.70, 0.75]
+    y = [1.63597, 1.73234, 1.87686, 2.03345, 2.22846, 2.35973]
+    x1 = [0.702, 0.512, 0.645, 0.736]
+
+    print("Кубический сплайн:")
+    print("|  x1  | natural | not-a-knot |")
+    print("|------|---------|------------|")
+    natural = CubicSpline(x, y)(np.array(x1))
+    not_a_knot = CubicSpline(x, y, bc="not-a-knot")(np.array(x1))
+    [print(f"|{x1[i]} |  {natural[i]:.3f}  |   {not_a_knot[i]:.3f}    |") for i in range(len(x1))]
+
+    x = np.array([1.34, 1.345, 1.35, 1.355, 1.36, 1.365, 1.37, 1.375, 1.38, 1.385, 1.39, 1.395])
+    y = np.array([4.25562, 4.35325, 4.45522, 4.56184, 4.67344, 4.79038,
+                  4.91306, 5.04192, 5.17744, 5.32016, 5.47069, 5.62968])
+    x1 = [1.3617, 1.3921, 1.3359, 1.4]
+    slopes = np.gradient(y, x, edge_order=2)[[0, -1]]  # оценки производных на концах таблицы
+    clamped = CubicSpline(x, y, bc="clamped", derivatives=tuple(slopes))
+
+    with tempfile.TemporaryDirectory() as directory:
+        clamped.save(directory)
+        mapped = CubicSpline.load(directory)
+        y1 = mapped(np.array(x1))
+        del mapped  # закрытие отображения перед удалением каталога
+    print("\n|  x1  | clamped |")
+    print("|------|---------|")
+    [print(f"|{x1[i]:.4f}|  {y1[i]:.3f}  |") for i in range(len(x1))]
@@ -0,0 +1,16 @@
+from comp_math.quad import adaptive_quadrature
+
+
+def main() -> None:
+    # Вычисление интегралов с заданной точностью
+    print("Адаптивное интегрирование:")
+    for rule in ("simpson", "trapezoid"):
+        cache = {}
+        for epsilon in (1e-6, 1e-10):
+            result = adaptive_quadrature(a=0.8, b=1.6, epsilon=epsilon, rule=rule, cache=cache)
+            print(f"{rule}, ε={epsilon:.0e}: {result.integral}, оценка погрешности {result.error:.1e}, "
+                  f"новых вычислений функции {result.evaluations}, интервалов {result.intervals}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+import numpy as np
+
+from comp_math.quad import batch_integrate
+
+
+def parametric_func(x, c):
+    return np.log10(x ** 2 + c) / x  # семейство подынтегральных функций с параметром c
+
+
+def main() -> None:
+    # интегралы от одной функции по множеству отрезков [0.8, b]
+    upper = np.linspace(1.0, 2.0, 500_000)
+    integrals = batch_integrate(0.8, upper, n=10, processes=None)
+    print(f"Интегралов по отрезкам [0.8, b]: {len(integrals)}")
+    print(f"b = {upper[-1]}: {integrals[-1]}")
+
+    # семейство функций с параметром на одном отрезке [0.8, 1.6]
+    c = np.linspace(0.5, 1.5, 11)
+    integrals = batch_integrate(0.8, 1.6, parametric_func, n=10, params=(c,))
+    print("Интегралы log10(x^2 + c) / x по отрезку [0.8, 1.6]:")
+    [print(f"c={c[i]:.1f}: {integrals[i]:.7f}") for i in range(len(c))]
+
+
+if __name__ == '__main__':
+    main()
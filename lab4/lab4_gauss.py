@@ -0,0 +1,15 @@
+from comp_math.quad import gauss_kronrod, gauss_legendre
+
+
+def main() -> None:
+    # Вычисление интегралов
+    print("Интеграл по формуле Гаусса-Лежандра:")
+    for n in (3, 5, 10):
+        print(f"n={n:<2}: {gauss_legendre(a=0.8, b=1.6, n=n)}")
+    integral, error = gauss_kronrod(a=0.8, b=1.6)
+    print(f"Интеграл по формуле Гаусса-Кронрода (7, 15): {integral}")
+    print(f"Оценка погрешности: {error:.1e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+from comp_math.quad import romberg
+
+
+def main() -> None:
+    # Вычисление интегралов с заданной точностью
+    print("Интеграл методом Ромберга:")
+    for epsilon in (1e-6, 1e-10):
+        result = romberg(a=0.8, b=1.6, epsilon=epsilon)
+        print(f"ε={epsilon:.0e}: {result.integral}, оценка погрешности {result.error:.1e}, "
+              f"вычислений функции {result.evaluations}")
+
+
+if __name__ == '__main__':
+    main()
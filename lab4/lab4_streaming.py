@@ -0,0 +1,35 @@
+import os
+import tempfile
+
+import numpy as np
+
+from comp_math.quad import func, simpson_rule, stream_cumulative, stream_integral
+
+
+def main() -> None:
+    a, b, n = 0.8, 1.6, 10_000_000
+    h = (b - a) / n
+
+    # отсчеты функции записываются в файл блоками и затем читаются блоками через numpy.memmap
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "signal.npy")
+        samples = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(n + 1,))
+        for start in range(0, n + 1, 2 ** 20):
+            stop = min(start + 2 ** 20, n + 1)
+            samples[start:stop] = func(a + h * np.arange(start, stop))
+        samples.flush()
+        del samples
+
+        print(f"Интеграл по {n + 1} отсчетам из файла:")
+        print(f"формула трапеций: {stream_integral(path, h)}")
+        print(f"формула Симпсона: {stream_integral(path, h, rule='simpson')}")
+    print(f"simpson_rule:     {simpson_rule(a, b, n=1000)}")
+
+    # накопленный интеграл по отсчетам, поступающим от генератора блоками разной длины
+    blocks = (func(np.linspace(a + 0.1 * i, a + 0.1 * (i + 1), 1001)[min(i, 1):]) for i in range(8))
+    cumulative = np.concatenate(list(stream_cumulative(blocks, 0.1 / 1000, rule="simpson")))
+    print(f"Накопленный интеграл в {len(cumulative)} четных узлах, на отрезке [0.8, 1.6]: {cumulative[-1]}")
+
+
+if __name__ == '__main__':
+    main()
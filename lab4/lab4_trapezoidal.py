@@ -1,34 +1,4 @@
-import math
-
-
-def func(x: float) -> float:
-    return math.log10(x ** 2 + 1) / x  # подынтегральная функция
-
-
-def trapezoidal_rule(a: float, b: float, n: int) -> float:
-    """
-       Вычисляет определенный интеграл функции с использованием метода трапеций.
-
-       Аргументы:
-           a (float): Нижний предел интегрирования.
-           b (float): Верхний предел интегрирования.
-           n (int): Количество интервалов, на которые разбивается область интегрирования.
-
-       Возвращает:
-           float: Приближенное значение определенного интеграла.
-       """
-    h = (b - a) / n  # шаг
-    integral = 0  # аккумулятор значения интеграла
-
-    for i in range(n + 1):
-        x = a + i * h  # вычисление значения x на основании шага и индекса текущей итерации
-        if i == 0 or i == n:
-            integral += func(x) / 2  # первое и последнее значение делятся на 2
-        else:
-            integral += func(x)  # остальные значения прибавляются без изменений
-
-    integral *= h  # умножение на шаг
-    return integral
+from comp_math.quad import trapezoidal_rule
 
 
 def main() -> None: